@@ -0,0 +1,11 @@
+#!/usr/bin/env sh
+# Fast local loop: re-run only the tests affected by source changes since the last run,
+# previously failing tests first. The first run records coverage into .testmondata.
+#   scripts/test-fast.sh
+#   scripts/test-fast.sh tests/test_scraper.py
+set -eu
+
+cd "$(dirname "$0")/.."
+
+# testmon tracks per-test coverage in-process, so run serially (-n 0)
+exec python -m pytest -n 0 --testmon --ff "$@"
@@ -0,0 +1,10 @@
+#!/usr/bin/env sh
+# Report the slowest tests and fail any single test that exceeds the time budget.
+#   scripts/test-report.sh                      # whole suite, 0.2s per test
+#   TEST_TIMEOUT=1 scripts/test-report.sh tests/test_poster.py
+set -eu
+
+cd "$(dirname "$0")/.."
+
+# Serial run (-n 0) so durations and timeouts measure the tests, not worker startup
+exec python -m pytest -n 0 --durations=20 --timeout="${TEST_TIMEOUT:-0.2}" "$@"
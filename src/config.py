@@ -3,39 +3,64 @@ Configuration management for the Twitter Bounty Bot.
 Loads environment variables and provides configuration constants.
 """
 import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once per process, even on reload)
+if not getattr(sys.modules[__name__], '_DOTENV_LOADED', False):
+    load_dotenv()
+    _DOTENV_LOADED = True
+
+# Frozen snapshot of the environment; all settings below are read from it
+_ENV = MappingProxyType(dict(os.environ))
+
+@lru_cache(maxsize=None)
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting, falling back to default when unset or empty."""
+    return int(_ENV.get(name) or default)
 
 # X/Twitter API Configuration
-TW_API_KEY = os.getenv('TW_API_KEY')
-TW_API_SECRET = os.getenv('TW_API_SECRET')
-TW_ACCESS_TOKEN = os.getenv('TW_ACCESS_TOKEN')
-TW_ACCESS_SECRET = os.getenv('TW_ACCESS_SECRET')
-TW_BEARER_TOKEN = os.getenv('TW_BEARER_TOKEN')
-OAUTH_CLIENT_ID = os.getenv('OAUTH_CLIENT_ID')
-OAUTH_CLIENT_SECRET = os.getenv('OAUTH_CLIENT_SECRET')
+TW_API_KEY = _ENV.get('TW_API_KEY')
+TW_API_SECRET = _ENV.get('TW_API_SECRET')
+TW_ACCESS_TOKEN = _ENV.get('TW_ACCESS_TOKEN')
+TW_ACCESS_SECRET = _ENV.get('TW_ACCESS_SECRET')
+TW_BEARER_TOKEN = _ENV.get('TW_BEARER_TOKEN')
+OAUTH_CLIENT_ID = _ENV.get('OAUTH_CLIENT_ID')
+OAUTH_CLIENT_SECRET = _ENV.get('OAUTH_CLIENT_SECRET')
 
 # Bounty site configuration
-BOUNTY_SITE_URL = os.getenv('BOUNTY_SITE_URL')
+BOUNTY_SITE_URL = _ENV.get('BOUNTY_SITE_URL')
 
 # Supabase configuration
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+SUPABASE_URL = _ENV.get('SUPABASE_URL')
+SUPABASE_KEY = _ENV.get('SUPABASE_KEY')
+SUPABASE_SERVICE_ROLE_KEY = _ENV.get('SUPABASE_SERVICE_ROLE_KEY')
 
 # Database configuration (fallback to SQLite for local dev)
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./data.db')
+DATABASE_URL = _ENV.get('DATABASE_URL', 'sqlite:///./data.db')
 
 # Optional third-party services
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-SENTRY_DSN = os.getenv('SENTRY_DSN')
+OPENAI_API_KEY = _ENV.get('OPENAI_API_KEY')
+SENTRY_DSN = _ENV.get('SENTRY_DSN')
+
+# LLM configuration (DeepSeek via Ollama)
+OLLAMA_BASE_URL = _ENV.get('OLLAMA_BASE_URL', 'http://localhost:11434')
+DEEPSEEK_MODEL = _ENV.get('DEEPSEEK_MODEL', 'deepseek-v3')
+MAX_TOKENS = _env_int('MAX_TOKENS', 2000)
+TEMPERATURE = float(_ENV.get('TEMPERATURE') or 0.7)
+# Concurrent generations to submit; match the Ollama server's OLLAMA_NUM_PARALLEL
+OLLAMA_NUM_PARALLEL = _env_int('OLLAMA_NUM_PARALLEL', 4)
+
+# Content strategy
+MAX_THREAD_LENGTH = _env_int('MAX_THREAD_LENGTH', 6)
+MIN_ENGAGEMENT_THRESHOLD = _env_int('MIN_ENGAGEMENT_THRESHOLD', 10)
 
 # Bot behavior configuration
-POST_INTERVAL_MINUTES = int(os.getenv('POST_INTERVAL_MINUTES', '10'))
-MAX_POSTS_PER_DAY = int(os.getenv('MAX_POSTS_PER_DAY', '10'))
-USER_DISPLAY_NAME = os.getenv('USER_DISPLAY_NAME', 'MyBountyBot')
+POST_INTERVAL_MINUTES = _env_int('POST_INTERVAL_MINUTES', 10)
+MAX_POSTS_PER_DAY = _env_int('MAX_POSTS_PER_DAY', 10)
+USER_DISPLAY_NAME = _ENV.get('USER_DISPLAY_NAME', 'MyBountyBot')
 
 # Rate limiting constants
 MAX_TWEET_LENGTH = 280
@@ -43,13 +68,18 @@ MIN_POST_INTERVAL_SECONDS = 60  # Minimum 1 minute between posts
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
 
+# Required settings, resolved once at import
+_REQUIRED = (
+    ('TW_API_KEY', TW_API_KEY),
+    ('TW_API_SECRET', TW_API_SECRET),
+    ('TW_ACCESS_TOKEN', TW_ACCESS_TOKEN),
+    ('TW_ACCESS_SECRET', TW_ACCESS_SECRET),
+)
+
 # Validation
 def validate_config():
     """Validate that required configuration is present."""
-    required_vars = [
-        'TW_API_KEY', 'TW_API_SECRET', 'TW_ACCESS_TOKEN', 'TW_ACCESS_SECRET'
-    ]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [name for name, value in _REQUIRED if not value]
     
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -2,21 +2,80 @@
 Content Generator for Crypto News Bot
 Uses LLM service to generate engaging Twitter content with context awareness.
 """
+import asyncio
+import bisect
+import heapq
 import logging
-from typing import List, Dict, Optional, Any
+import re
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from .llm_service import OllamaService
 from .storage import get_recent_posts, get_engagement_data
 from .config import MAX_THREAD_LENGTH, MIN_ENGAGEMENT_THRESHOLD
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for cleaning LLM output
+_TWEET_PREFIX_RE = re.compile(r'Tweet [1-9]:')
+_META_PREFIX_RE = re.compile(r'^(?:Thread|Content):\s*')
+_WS_RE = re.compile(r'\s+')
+
+# Keywords marking a bounty as crypto/Web3 related
+_BOUNTY_KEYWORDS = ('crypto', 'blockchain', 'web3', 'defi', 'nft', 'dao', 'token')
+
+# Single-pass keyword matcher (Aho-Corasick), built once when available
+_BOUNTY_KEYWORD_AUTOMATON = None
+if ahocorasick is not None:
+    _BOUNTY_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _BOUNTY_KEYWORDS:
+        _BOUNTY_KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _BOUNTY_KEYWORD_AUTOMATON.make_automaton()
+
+# Plan-wide context entries that are consumed by the context builders
+_SHARED_CONTEXT_KEYS = frozenset({
+    'recent_posts_24h', 'engagement_24h', 'recent_bounty_posts_7d', 'bounty_engagement_7d'
+})
+
+# Bounty categories that get a priority boost (exact label or contained in a phrase)
+_PRIORITY_CATEGORIES = frozenset({'content', 'writing', 'social', 'marketing'})
+
+# Optimal posting hours (sorted): news works well in morning and afternoon,
+# bounty posts in the evening
+_NEWS_HOURS = (8, 12, 16, 20)
+_BOUNTY_HOURS = (18, 19, 20, 21)
+
+# Content templates for fallback generation (static, shared by all instances)
+_CONTENT_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    'news': (
+        "🔔 {title}",
+        "📈 {summary}",
+        "🔗 Read more: {url} | Follow for crypto updates! #Crypto #Web3"
+    ),
+    'bounty': (
+        "💰 New bounty opportunity: {title}",
+        "🎯 {description}",
+        "⏰ Deadline: {deadline} | Reward: {reward}",
+        "🔗 Apply: {url} | RT if you're interested! #Bounty #Crypto"
+    )
+}
+
 class ContentGenerator:
     """Generates Twitter content using LLM with context awareness."""
     
+    __slots__ = ('llm_service', 'content_templates')
+    
     def __init__(self):
+        # Imported lazily so importing this module doesn't load the HTTP client stack
+        from .llm_service import OllamaService
         self.llm_service = OllamaService()
-        self.content_templates = self._load_templates()
+        self.content_templates = _CONTENT_TEMPLATES
     
     def generate_news_thread(self, article: Dict, context: Dict = None) -> List[str]:
         """
@@ -39,11 +98,11 @@ class ContentGenerator:
             # Validate and clean the thread
             validated_thread = self._validate_thread(thread, 'news')
             
-            logger.info(f"Generated news thread with {len(validated_thread)} tweets")
+            logger.info("Generated news thread with %d tweets", len(validated_thread))
             return validated_thread
             
         except Exception as e:
-            logger.error(f"Error generating news thread: {e}")
+            logger.error("Error generating news thread: %s", e)
             # Fallback to template-based generation
             return self._generate_template_news_thread(article)
     
@@ -68,27 +127,61 @@ class ContentGenerator:
             # Validate and clean the thread
             validated_thread = self._validate_thread(thread, 'bounty')
             
-            logger.info(f"Generated bounty thread with {len(validated_thread)} tweets")
+            logger.info("Generated bounty thread with %d tweets", len(validated_thread))
             return validated_thread
             
         except Exception as e:
-            logger.error(f"Error generating bounty thread: {e}")
+            logger.error("Error generating bounty thread: %s", e)
             # Fallback to template-based generation
             return self._generate_template_bounty_thread(bounty)
     
-    def generate_daily_content_plan(self, news_articles: List[Dict], bounties: List[Dict]) -> List[Dict]:
+    def warm_up(self) -> bool:
+        """Load the LLM and its system prompts so the first thread doesn't pay the cold start."""
+        return self.llm_service.warm_up()
+    
+    def generate_daily_content_plan(self, news_articles: List[Dict], bounties: List[Dict],
+                                    max_items: Optional[int] = None) -> List[Dict]:
         """
         Generate a daily content plan with scheduled posts.
         
         Args:
             news_articles: List of news articles
             bounties: List of bounty opportunities
+            max_items: Keep only this many highest-priority items (default: keep all)
+            
+        Returns:
+            List of scheduled content items
+            
+        Raises:
+            RuntimeError: If called from a running event loop; await
+                agenerate_daily_content_plan there instead
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_daily_content_plan(news_articles, bounties, max_items))
+        raise RuntimeError(
+            "generate_daily_content_plan() cannot run inside an event loop; "
+            "await agenerate_daily_content_plan() instead"
+        )
+    
+    async def agenerate_daily_content_plan(self, news_articles: List[Dict], bounties: List[Dict],
+                                           max_items: Optional[int] = None) -> List[Dict]:
+        """
+        Generate a daily content plan, submitting all thread generations as one batch.
+        
+        Args:
+            news_articles: List of news articles
+            bounties: List of bounty opportunities
+            max_items: Keep only this many highest-priority items (default: keep all)
             
         Returns:
             List of scheduled content items
         """
         try:
-            content_plan = []
+            # Use a single timestamp for the whole plan
+            now = datetime.now()
+            plan_context = {'current_time': now.isoformat()}
             
             # Calculate content mix based on configuration
             news_count = int(len(news_articles) * 0.8)  # 80% news
@@ -100,85 +193,144 @@ class ContentGenerator:
             # Select relevant bounties
             relevant_bounties = self._select_relevant_bounties(bounties, bounty_count)
             
-            # Generate content for each item
-            for article in top_news:
-                thread = self.generate_news_thread(article)
-                if thread:
-                    content_plan.append({
-                        'type': 'news',
-                        'content': thread,
-                        'source_data': article,
-                        'scheduled_time': self._calculate_optimal_time('news'),
-                        'priority': self._calculate_news_priority(article)
-                    })
+            # Fetch posting history and engagement once for the whole plan
+            if top_news:
+                plan_context['recent_posts_24h'] = get_recent_posts(hours=24)[:5]
+                plan_context['engagement_24h'] = get_engagement_data(hours=24)
+            if relevant_bounties:
+                plan_context['recent_bounty_posts_7d'] = get_recent_posts(hours=168, content_type='bounty')[:3]
+                plan_context['bounty_engagement_7d'] = get_engagement_data(hours=168, content_type='bounty')
             
-            for bounty in relevant_bounties:
-                thread = self.generate_bounty_thread(bounty)
-                if thread:
-                    content_plan.append({
-                        'type': 'bounty',
-                        'content': thread,
-                        'source_data': bounty,
-                        'scheduled_time': self._calculate_optimal_time('bounty'),
-                        'priority': self._calculate_bounty_priority(bounty)
-                    })
+            # Submit every generation as one batch so the LLM server can run them side by side;
+            # items this generator already produced threads for (e.g. on an earlier run of the
+            # plan today) are served from the LLM service's thread cache
+            items = [
+                ('news', article, self._build_news_context(article, plan_context)) for article in top_news
+            ] + [
+                ('bounty', bounty, self._build_bounty_context(bounty, plan_context)) for bounty in relevant_bounties
+            ]
+            threads = await self.llm_service.agenerate_threads_batch(items)
             
-            # Sort by priority and schedule
-            content_plan.sort(key=lambda x: x['priority'], reverse=True)
+            # Score the generated items; scheduling is deferred until after selection
+            candidates = []
+            for (content_type, source_data, _), thread in zip(items, threads):
+                thread = self._finish_thread(content_type, source_data, thread)
+                if not thread:
+                    continue
+                if content_type == 'news':
+                    priority = self._calculate_news_priority(source_data, now)
+                else:
+                    priority = self._calculate_bounty_priority(source_data, now)
+                candidates.append((priority, content_type, thread, source_data))
             
-            logger.info(f"Generated content plan with {len(content_plan)} items")
+            # Sort by priority; with a cap, select only the top items instead of sorting everything
+            if max_items is None:
+                top_items = sorted(candidates, key=itemgetter(0), reverse=True)
+            else:
+                top_items = heapq.nlargest(max_items, candidates, key=itemgetter(0))
+            content_plan = [
+                {
+                    'type': content_type,
+                    'content': thread,
+                    'source_data': source_data,
+                    'scheduled_time': self._calculate_optimal_time(content_type, now),
+                    'priority': priority
+                }
+                for priority, content_type, thread, source_data in top_items
+            ]
+            
+            logger.info("Generated content plan with %d items", len(content_plan))
             return content_plan
             
         except Exception as e:
-            logger.error(f"Error generating daily content plan: {e}")
+            logger.error("Error generating daily content plan: %s", e)
             return []
     
+    def _finish_thread(self, content_type: str, source_data: Dict, thread) -> List[str]:
+        """
+        Validate a thread from a batch generation, or fall back to the template.
+        
+        Args:
+            content_type: 'news' or 'bounty'
+            source_data: The source article or bounty data
+            thread: The generated thread, or the exception its generation raised
+            
+        Returns:
+            List of tweet strings for the thread
+        """
+        try:
+            if isinstance(thread, Exception):
+                raise thread
+            
+            validated_thread = self._validate_thread(thread, content_type)
+            logger.info("Generated %s thread with %d tweets", content_type, len(validated_thread))
+            return validated_thread
+            
+        except Exception as e:
+            logger.error("Error generating %s thread: %s", content_type, e)
+            if content_type == 'news':
+                return self._generate_template_news_thread(source_data)
+            return self._generate_template_bounty_thread(source_data)
+    
     def _build_news_context(self, article: Dict, context: Dict = None) -> Dict:
         """Build context for news content generation."""
+        context = context or {}
         base_context = {
             'article_title': article.get('title', ''),
             'article_category': article.get('category', ''),
             'article_source': article.get('source', ''),
-            'current_time': datetime.now().isoformat(),
+            'current_time': context.get('current_time') or datetime.now().isoformat(),
             'content_type': 'news'
         }
         
-        # Add recent posting history
-        recent_posts = get_recent_posts(hours=24)
-        base_context['recent_posts'] = recent_posts[:5]  # Last 5 posts
+        # Add recent posting history (reuse the plan's copy, already cut to 5, when provided;
+        # passing the same list object lets a batch render it once)
+        if 'recent_posts_24h' in context:
+            recent_posts = context['recent_posts_24h']
+        else:
+            recent_posts = get_recent_posts(hours=24)[:5]  # Last 5 posts
+        base_context['recent_posts'] = recent_posts
         
         # Add engagement data
-        engagement_data = get_engagement_data(hours=24)
+        if 'engagement_24h' in context:
+            engagement_data = context['engagement_24h']
+        else:
+            engagement_data = get_engagement_data(hours=24)
         base_context['recent_engagement'] = engagement_data
         
         # Add trending topics (if available)
-        if context:
-            base_context.update(context)
+        base_context.update(_caller_context(context))
         
         return base_context
     
     def _build_bounty_context(self, bounty: Dict, context: Dict = None) -> Dict:
         """Build context for bounty content generation."""
+        context = context or {}
         base_context = {
             'bounty_title': bounty.get('title', ''),
             'bounty_reward': bounty.get('reward_amount', ''),
             'bounty_currency': bounty.get('reward_currency', 'USDC'),
             'bounty_deadline': bounty.get('deadline', ''),
             'bounty_category': bounty.get('category', ''),
-            'current_time': datetime.now().isoformat(),
+            'current_time': context.get('current_time') or datetime.now().isoformat(),
             'content_type': 'bounty'
         }
         
-        # Add recent bounty posting history
-        recent_bounty_posts = get_recent_posts(hours=168, content_type='bounty')  # Last week
-        base_context['recent_bounty_posts'] = recent_bounty_posts[:3]
+        # Add recent bounty posting history (reuse the plan's copy, already cut to 3, when provided)
+        if 'recent_bounty_posts_7d' in context:
+            recent_bounty_posts = context['recent_bounty_posts_7d']
+        else:
+            recent_bounty_posts = get_recent_posts(hours=168, content_type='bounty')[:3]  # Last week
+        base_context['recent_bounty_posts'] = recent_bounty_posts
         
         # Add engagement data for bounty posts
-        bounty_engagement = get_engagement_data(hours=168, content_type='bounty')
+        if 'bounty_engagement_7d' in context:
+            bounty_engagement = context['bounty_engagement_7d']
+        else:
+            bounty_engagement = get_engagement_data(hours=168, content_type='bounty')
         base_context['bounty_engagement'] = bounty_engagement
         
-        if context:
-            base_context.update(context)
+        base_context.update(_caller_context(context))
         
         return base_context
     
@@ -187,92 +339,60 @@ class ContentGenerator:
         if not thread:
             return []
         
-        validated_thread = []
-        for tweet in thread:
-            # Basic validation
-            if tweet and len(tweet) <= 280 and len(tweet) > 10:
-                # Clean up common issues
-                cleaned_tweet = self._clean_tweet(tweet)
-                if cleaned_tweet:
-                    validated_thread.append(cleaned_tweet)
+        def _valid_tweets():
+            for tweet in thread:
+                # Basic validation (cheap truthiness check before measuring)
+                length = len(tweet) if tweet else 0
+                if 10 < length <= 280:
+                    # Clean up common issues
+                    cleaned_tweet = self._clean_tweet(tweet)
+                    if cleaned_tweet and len(cleaned_tweet) <= 280:
+                        yield cleaned_tweet
         
-        # Ensure we don't exceed maximum thread length
-        return validated_thread[:MAX_THREAD_LENGTH]
+        # Stop cleaning once the maximum thread length is reached
+        return list(islice(_valid_tweets(), MAX_THREAD_LENGTH))
     
     def _clean_tweet(self, tweet: str) -> str:
         """Clean up generated tweet content."""
         # Remove common LLM artifacts
-        tweet = tweet.replace('Tweet 1:', '').replace('Tweet 2:', '').replace('Tweet 3:', '')
-        tweet = tweet.replace('Tweet 4:', '').replace('Tweet 5:', '').replace('Tweet 6:', '')
+        tweet = _TWEET_PREFIX_RE.sub('', tweet)
         
         # Remove excessive whitespace
-        tweet = ' '.join(tweet.split())
+        tweet = _WS_RE.sub(' ', tweet).strip()
         
         # Ensure it starts with content, not metadata
-        if tweet.startswith('Thread:') or tweet.startswith('Content:'):
-            tweet = tweet.split(':', 1)[1].strip()
-        
-        return tweet.strip()
+        return _META_PREFIX_RE.sub('', tweet)
     
     def _select_top_news(self, articles: List[Dict], count: int) -> List[Dict]:
         """Select top news articles based on relevance and engagement potential."""
-        # Sort by relevance score and sentiment
-        sorted_articles = sorted(
-            articles,
-            key=lambda x: (
-                x.get('relevance_score', 0),
-                x.get('sentiment_score', 0)
-            ),
-            reverse=True
-        )
-        
-        return sorted_articles[:count]
+        # Take the top articles by relevance score and sentiment
+        return heapq.nlargest(count, articles, key=_news_sort_key)
     
     def _select_relevant_bounties(self, bounties: List[Dict], count: int) -> List[Dict]:
         """Select relevant bounty opportunities."""
         # Filter for crypto/Web3 related bounties
-        relevant_bounties = [
-            bounty for bounty in bounties
-            if any(keyword in bounty.get('title', '').lower() or 
-                   keyword in bounty.get('description', '').lower()
-                   for keyword in ['crypto', 'blockchain', 'web3', 'defi', 'nft', 'dao', 'token'])
-        ]
+        relevant_bounties = [bounty for bounty in bounties if _is_relevant_bounty(bounty)]
         
-        # Sort by reward amount and deadline
-        sorted_bounties = sorted(
-            relevant_bounties,
-            key=lambda x: (
-                float(x.get('reward_amount', '0').replace('USDC', '').replace(',', '') or 0),
-                x.get('deadline', '')
-            ),
-            reverse=True
-        )
-        
-        return sorted_bounties[:count]
+        # Take the top bounties by reward amount and deadline
+        return heapq.nlargest(count, relevant_bounties, key=_bounty_sort_key)
     
-    def _calculate_optimal_time(self, content_type: str) -> datetime:
+    def _calculate_optimal_time(self, content_type: str, now: datetime = None) -> datetime:
         """Calculate optimal posting time based on content type and engagement data."""
-        now = datetime.now()
+        now = now or datetime.now()
         
         # Base optimal times for different content types
-        if content_type == 'news':
-            # News posts work well in morning and afternoon
-            optimal_hours = [8, 12, 16, 20]
-        else:  # bounty
-            # Bounty posts work well in evening
-            optimal_hours = [18, 19, 20, 21]
+        optimal_hours = _NEWS_HOURS if content_type == 'news' else _BOUNTY_HOURS
         
-        # Find next optimal hour
-        for hour in optimal_hours:
-            optimal_time = now.replace(hour=hour, minute=0, second=0, microsecond=0)
-            if optimal_time > now:
-                return optimal_time
+        # Find next optimal hour (the first one strictly after the current hour)
+        index = bisect.bisect_right(optimal_hours, now.hour)
+        if index < len(optimal_hours):
+            return now.replace(hour=optimal_hours[index], minute=0, second=0, microsecond=0)
         
         # If no optimal time today, use tomorrow
         tomorrow = now + timedelta(days=1)
         return tomorrow.replace(hour=optimal_hours[0], minute=0, second=0, microsecond=0)
     
-    def _calculate_news_priority(self, article: Dict) -> float:
+    def _calculate_news_priority(self, article: Dict, now: datetime = None) -> float:
         """Calculate priority score for news article."""
         priority = 0.0
         
@@ -285,77 +405,92 @@ class ContentGenerator:
         # Recency (newer is better)
         published_at = article.get('published_at')
         if published_at:
-            hours_old = (datetime.now() - published_at).total_seconds() / 3600
+            hours_old = ((now or datetime.now()) - published_at).total_seconds() / 3600
             priority += max(0, 1 - hours_old / 24) * 0.3
         
         return priority
     
-    def _calculate_bounty_priority(self, bounty: Dict) -> float:
+    def _calculate_bounty_priority(self, bounty: Dict, now: datetime = None) -> float:
         """Calculate priority score for bounty opportunity."""
         priority = 0.0
         
         # Reward amount
-        reward_amount = float(bounty.get('reward_amount', '0').replace('USDC', '').replace(',', '') or 0)
+        reward_amount = _parse_reward(bounty.get('reward_amount') or '')
         priority += min(reward_amount / 1000, 1.0) * 0.4  # Normalize to 0-1
         
         # Deadline urgency
         deadline = bounty.get('deadline')
         if deadline:
-            days_left = (deadline - datetime.now()).days
+            days_left = (deadline - (now or datetime.now())).days
             priority += max(0, 1 - days_left / 30) * 0.3  # More urgent = higher priority
         
         # Category relevance
-        category = bounty.get('category', '').lower()
-        if any(keyword in category for keyword in ['content', 'writing', 'social', 'marketing']):
+        category = (bounty.get('category') or '').lower()
+        if category in _PRIORITY_CATEGORIES or any(keyword in category for keyword in _PRIORITY_CATEGORIES):
             priority += 0.3
         
         return priority
     
-    def _load_templates(self) -> Dict[str, List[str]]:
-        """Load content templates for fallback generation."""
-        return {
-            'news': [
-                "🔔 {title}",
-                "📈 {summary}",
-                "🔗 Read more: {url} | Follow for crypto updates! #Crypto #Web3"
-            ],
-            'bounty': [
-                "💰 New bounty opportunity: {title}",
-                "🎯 {description}",
-                "⏰ Deadline: {deadline} | Reward: {reward}",
-                "🔗 Apply: {url} | RT if you're interested! #Bounty #Crypto"
-            ]
-        }
-    
     def _generate_template_news_thread(self, article: Dict) -> List[str]:
         """Generate news thread using templates as fallback."""
         template = self.content_templates['news']
-        return [
-            template[0].format(title=article.get('title', '')[:200]),
-            template[1].format(summary=article.get('content', '')[:150]),
-            template[2].format(url=article.get('url', ''))
-        ]
+        values = {
+            'title': article.get('title', '')[:200],
+            'summary': article.get('content', '')[:150],
+            'url': article.get('url', '')
+        }
+        return [line.format_map(values) for line in template]
     
     def _generate_template_bounty_thread(self, bounty: Dict) -> List[str]:
         """Generate bounty thread using templates as fallback."""
         template = self.content_templates['bounty']
-        return [
-            template[0].format(title=bounty.get('title', '')[:200]),
-            template[1].format(description=bounty.get('description', '')[:150]),
-            template[2].format(
-                deadline=bounty.get('deadline', 'TBD'),
-                reward=bounty.get('reward_amount', 'TBD')
-            ),
-            template[3].format(url=bounty.get('url', ''))
-        ]
+        values = {
+            'title': bounty.get('title', '')[:200],
+            'description': bounty.get('description', '')[:150],
+            'deadline': bounty.get('deadline', 'TBD'),
+            'reward': bounty.get('reward_amount', 'TBD'),
+            'url': bounty.get('url', '')
+        }
+        return [line.format_map(values) for line in template]
+
+def _caller_context(context: Dict) -> Dict:
+    """Return the caller-supplied context without the shared plan-wide entries."""
+    return {key: value for key, value in context.items() if key not in _SHARED_CONTEXT_KEYS}
+
+@lru_cache(maxsize=4096)
+def _parse_reward(raw: str) -> float:
+    """Parse a reward string such as '1,000 USDC' into a float."""
+    return float(raw.replace('USDC', '').replace(',', '').strip() or 0)
+
+def _news_sort_key(article: Dict) -> Tuple:
+    """Ranking key for news articles: relevance, then sentiment."""
+    return (article.get('relevance_score', 0), article.get('sentiment_score', 0))
+
+def _bounty_sort_key(bounty: Dict) -> Tuple:
+    """Ranking key for bounties: reward amount, then deadline."""
+    return (_parse_reward(bounty.get('reward_amount') or ''), bounty.get('deadline', ''))
+
+def _is_relevant_bounty(bounty: Dict) -> bool:
+    """Check whether a bounty's title or description mentions a crypto/Web3 keyword."""
+    haystack = f"{bounty.get('title', '')} {bounty.get('description', '')}".lower()
+    if _BOUNTY_KEYWORD_AUTOMATON is not None:
+        return next(_BOUNTY_KEYWORD_AUTOMATON.iter(haystack), None) is not None
+    return any(keyword in haystack for keyword in _BOUNTY_KEYWORDS)
+
+@lru_cache(maxsize=None)
+def _default_content_generator() -> ContentGenerator:
+    """Return the shared content generator, creating it on first use."""
+    return ContentGenerator()
+
+def warm_up() -> bool:
+    """Warm up the default content generator; call once at startup, before the first thread."""
+    return _default_content_generator().warm_up()
 
 # Convenience functions for backward compatibility
 def generate_news_thread(article: Dict, context: Dict = None) -> List[str]:
     """Generate news thread using default content generator."""
-    generator = ContentGenerator()
-    return generator.generate_news_thread(article, context)
+    return _default_content_generator().generate_news_thread(article, context)
 
 def generate_bounty_thread(bounty: Dict, context: Dict = None) -> List[str]:
     """Generate bounty thread using default content generator."""
-    generator = ContentGenerator()
-    return generator.generate_bounty_thread(bounty, context)
+    return _default_content_generator().generate_bounty_thread(bounty, context)
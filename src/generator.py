@@ -2,17 +2,59 @@
 Thread generation for the Twitter Bounty Bot.
 Creates Twitter threads from bounty data using templates or LLM.
 """
+import asyncio
 import json
 import logging
+import re
+from functools import lru_cache
 from typing import List, Dict, Optional
 from .config import OPENAI_API_KEY, MAX_TWEET_LENGTH
 from .utils import truncate_text, sanitize_text, validate_tweet_content
 
+try:
+    import openai
+except ImportError:
+    openai = None
+
 logger = logging.getLogger(__name__)
 
+# Leading tweet numbering such as "1." or "2)"
+_NUMBER_PREFIX_RE = re.compile(r'^\d+[.)]\s*')
+
+# Static system prompt, sent verbatim with every request
+_SYSTEM_PROMPT = (
+    "You are a Twitter bot that creates engaging threads about crypto bounties. "
+    "Create 3-4 tweets that are informative, engaging, and follow Twitter best practices. "
+    "Each tweet must be under 280 characters. Include relevant hashtags but don't overuse them."
+)
+
+# User prompt template; only the bounty fields vary between requests
+_USER_PROMPT_TEMPLATE = """
+Create a Twitter thread about this bounty:
+
+Title: {title}
+Description: {description}
+URL: {url}
+
+Requirements:
+- 3-4 tweets maximum
+- Each tweet under 280 characters
+- Engaging and informative
+- Include relevant hashtags
+- End with a call-to-action
+- Format each tweet on a new line
+"""
+
+@lru_cache(maxsize=1)
+def _get_openai_client(api_key: str):
+    """Return a shared OpenAI client so its connection pool is reused."""
+    return openai.OpenAI(api_key=api_key)
+
 class ThreadGenerator:
     """Generates Twitter threads from bounty data."""
     
+    __slots__ = ('use_llm', 'openai_client')
+    
     def __init__(self, use_llm: bool = False):
         self.use_llm = use_llm and bool(OPENAI_API_KEY)
         if self.use_llm:
@@ -20,15 +62,16 @@ class ThreadGenerator:
     
     def _setup_openai(self):
         """Setup OpenAI client if API key is available."""
-        try:
-            import openai
-            self.openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
-            logger.info("OpenAI client initialized for LLM thread generation")
-        except ImportError:
+        if openai is None:
             logger.warning("OpenAI package not installed. Falling back to template generation.")
             self.use_llm = False
+            return
+        
+        try:
+            self.openai_client = _get_openai_client(OPENAI_API_KEY)
+            logger.info("OpenAI client initialized for LLM thread generation")
         except Exception as e:
-            logger.warning(f"Failed to initialize OpenAI client: {e}. Falling back to template generation.")
+            logger.warning("Failed to initialize OpenAI client: %s. Falling back to template generation.", e)
             self.use_llm = False
     
     def generate_thread(self, bounty: Dict) -> List[str]:
@@ -46,6 +89,18 @@ class ThreadGenerator:
         else:
             return self._generate_with_template(bounty)
     
+    async def agenerate_thread(self, bounty: Dict) -> List[str]:
+        """
+        Async variant of generate_thread so several bounties can be generated concurrently.
+        
+        Args:
+            bounty: Dictionary containing bounty information
+            
+        Returns:
+            List of tweet texts for the thread
+        """
+        return await asyncio.to_thread(self.generate_thread, bounty)
+    
     def _generate_with_template(self, bounty: Dict) -> List[str]:
         """
         Generate thread using predefined templates.
@@ -85,7 +140,7 @@ class ThreadGenerator:
             if validate_tweet_content(tweet):
                 validated_thread.append(tweet)
             else:
-                logger.warning(f"Generated tweet failed validation: {tweet}")
+                logger.warning("Generated tweet failed validation: %s", tweet)
         
         return validated_thread
     
@@ -107,7 +162,7 @@ class ThreadGenerator:
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a Twitter bot that creates engaging threads about crypto bounties. Create 3-4 tweets that are informative, engaging, and follow Twitter best practices. Each tweet must be under 280 characters. Include relevant hashtags but don't overuse them."
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -128,46 +183,29 @@ class ThreadGenerator:
                 if validate_tweet_content(tweet):
                     validated_tweets.append(tweet)
                 else:
-                    logger.warning(f"LLM-generated tweet failed validation: {tweet}")
+                    logger.warning("LLM-generated tweet failed validation: %s", tweet)
             
             return validated_tweets if validated_tweets else self._generate_with_template(bounty)
             
         except Exception as e:
-            logger.error(f"LLM generation failed: {e}. Falling back to template generation.")
+            logger.error("LLM generation failed: %s. Falling back to template generation.", e)
             return self._generate_with_template(bounty)
     
     def _build_llm_prompt(self, bounty: Dict) -> str:
         """Build the prompt for LLM generation."""
-        return f"""
-        Create a Twitter thread about this bounty:
-        
-        Title: {bounty.get('title', '')}
-        Description: {bounty.get('description', '')}
-        URL: {bounty.get('url', '')}
-        
-        Requirements:
-        - 3-4 tweets maximum
-        - Each tweet under 280 characters
-        - Engaging and informative
-        - Include relevant hashtags
-        - End with a call-to-action
-        - Format each tweet on a new line
-        """
+        return _USER_PROMPT_TEMPLATE.format_map({
+            'title': bounty.get('title', ''),
+            'description': bounty.get('description', ''),
+            'url': bounty.get('url', '')
+        })
     
     def _parse_llm_response(self, content: str) -> List[str]:
         """Parse LLM response into individual tweets."""
-        # Split by newlines and clean up
-        tweets = [line.strip() for line in content.split('\n') if line.strip()]
-        
-        # Remove numbering if present (1. 2. 3. etc.)
-        cleaned_tweets = []
-        for tweet in tweets:
-            # Remove leading numbers and dots
-            if tweet and tweet[0].isdigit():
-                tweet = tweet.split('.', 1)[1].strip() if '.' in tweet else tweet[1:].strip()
-            cleaned_tweets.append(tweet)
-        
-        return cleaned_tweets
+        # Split by newlines, dropping blank lines and numbering (1. 2) etc.) in one pass
+        return [
+            tweet for line in content.splitlines()
+            if (tweet := _NUMBER_PREFIX_RE.sub('', line.strip()))
+        ]
     
     def validate_thread(self, thread: List[str]) -> bool:
         """
@@ -191,6 +229,11 @@ class ThreadGenerator:
         
         return True
 
+@lru_cache(maxsize=2)
+def _default_thread_generator(use_llm: bool) -> ThreadGenerator:
+    """Return the shared thread generator for the given mode, creating it on first use."""
+    return ThreadGenerator(use_llm=use_llm)
+
 # Convenience function for backward compatibility
 def generate_thread(bounty: Dict, use_llm: bool = False) -> List[str]:
     """
@@ -203,5 +246,4 @@ def generate_thread(bounty: Dict, use_llm: bool = False) -> List[str]:
     Returns:
         List of tweet texts for the thread
     """
-    generator = ThreadGenerator(use_llm=use_llm)
-    return generator.generate_thread(bounty)
+    return _default_thread_generator(bool(use_llm)).generate_thread(bounty)
@@ -3,24 +3,184 @@ LLM Service for Crypto News Bot
 Handles DeepSeek model integration via Ollama for content generation.
 """
 import requests
+import httpx
 import json
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+import re
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple, Union
 from datetime import datetime
-from .config import OLLAMA_BASE_URL, DEEPSEEK_MODEL, MAX_TOKENS, TEMPERATURE
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .config import OLLAMA_BASE_URL, DEEPSEEK_MODEL, MAX_TOKENS, TEMPERATURE, OLLAMA_NUM_PARALLEL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+def _json_dumps_indented(obj) -> str:
+    """Serialize obj as two-space indented JSON (non-ASCII text is kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Static instructions sent as the Ollama "system" field. They are byte-identical
+# across calls so Ollama can reuse the evaluated prefix; only the per-item data
+# goes into the prompt.
+NEWS_SYSTEM_PROMPT = """You are a crypto news bot that creates engaging Twitter threads about cryptocurrency and Web3 news.
+
+Create a Twitter thread (3-6 tweets) that:
+1. Captures the key points of the news
+2. Explains why it matters to the crypto community
+3. Uses engaging language and relevant hashtags
+4. Maintains a professional but accessible tone
+5. Includes a call-to-action for engagement
+
+Format each tweet on a new line, starting with "Tweet 1:", "Tweet 2:", etc.
+Keep each tweet under 280 characters.
+Use relevant crypto hashtags but don't overuse them.
+Make it engaging and shareable.
+"""
+
+BOUNTY_SYSTEM_PROMPT = """You are a crypto bounty bot that creates engaging Twitter threads about bounty opportunities.
+
+Create a Twitter thread (3-4 tweets) that:
+1. Introduces the bounty opportunity naturally
+2. Explains what skills are needed
+3. Highlights the reward and deadline
+4. Encourages qualified developers to apply
+5. Feels organic and not spammy
+
+Format each tweet on a new line, starting with "Tweet 1:", "Tweet 2:", etc.
+Keep each tweet under 280 characters.
+Use relevant hashtags but keep it natural.
+Make it appealing to developers and builders.
+"""
+
+_SYSTEM_PROMPTS = {
+    'news': NEWS_SYSTEM_PROMPT,
+    'bounty': BOUNTY_SYSTEM_PROMPT
+}
+
+# (connect, read) timeout in seconds for every Ollama request; the short connect
+# timeout makes a stopped Ollama fail fast instead of stalling the scheduler
+REQUEST_TIMEOUT = (3.05, 120)
+
+# A numbered tweet line such as "Tweet 1: ..." (captures the tweet text, without the
+# trailing whitespace or the \r of a CRLF line ending)
+_TWEET_LINE_RE = re.compile(r'^[ \t]*Tweet[ \t]*\d+[ \t]*:[ \t]*(\S[^\r\n]*?)[ \t\r]*$', re.MULTILINE)
+
+# Maximum tweets per generated thread
+MAX_THREAD_TWEETS = 6
+
+def _append_stream_chunk(parts: List[str], line, max_tweets: int = None) -> bool:
+    """
+    Add one streamed /api/generate JSON line to parts.
+    
+    Returns:
+        True when generation is done or max_tweets complete tweet lines have arrived
+    """
+    if not line:
+        return False
+    
+    chunk = _json_loads(line)
+    parts.append(chunk.get("response", ""))
+    if chunk.get("done"):
+        return True
+    
+    if max_tweets and '\n' in parts[-1]:
+        complete_lines, _, _ = ''.join(parts).rpartition('\n')
+        tweet_count = sum(1 for tweet in _TWEET_LINE_RE.findall(complete_lines) if len(tweet) <= 280)
+        if tweet_count >= max_tweets:
+            logger.info("Stopping generation early after %d tweets", tweet_count)
+            return True
+    
+    return False
+
+# Generated threads are reused for identical inputs within this window
+THREAD_CACHE_TTL_SECONDS = 24 * 3600
+THREAD_CACHE_MAX_ENTRIES = 256
+
+# Fields that identify an article or bounty for response caching: its identity (id, url)
+# plus everything the prompts read, so a cached thread never carries another item's details
+_FINGERPRINT_FIELDS = (
+    'id', 'url', 'title', 'description', 'content', 'source', 'category',
+    'reward_amount', 'reward_currency', 'deadline',
+)
+
+def _fingerprint(source_data: Dict) -> str:
+    """Build a normalized cache key from an article or bounty (case and whitespace insensitive)."""
+    return '|'.join(
+        ' '.join(str(source_data.get(field) or '').lower().split())
+        for field in _FINGERPRINT_FIELDS
+    )
+
+# Rendered JSON of shared context values (posting history, engagement), memoized by
+# identity only while one agenerate_threads_batch call runs, so later in-place edits
+# to those values are never masked by stale JSON
+_context_json_memo: ContextVar[Optional[Dict[int, Tuple[Any, str]]]] = ContextVar(
+    '_context_json_memo', default=None
+)
+
+# How long an /api/tags model listing is reused before asking Ollama again
+TAGS_CACHE_TTL_SECONDS = 300
+
+# How long Ollama keeps the model (and its prompt cache) loaded between calls
+KEEP_ALIVE = "30m"
+
 class OllamaService:
     """Service for interacting with DeepSeek model via Ollama."""
     
     def __init__(self, base_url: str = None, model: str = None):
         self.base_url = base_url or OLLAMA_BASE_URL
         self.model = model or DEEPSEEK_MODEL
+        # Generations in flight at once; the server interleaves up to OLLAMA_NUM_PARALLEL
+        self.max_parallel = max(1, OLLAMA_NUM_PARALLEL)
         self.session = requests.Session()
-        self.session.timeout = 60
+        # Keep connections to Ollama alive between calls and retry transient gateway errors;
+        # connection failures are not retried so a stopped Ollama fails fast
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({'GET', 'POST'})
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.aclient = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+        )
+        self._thread_cache: OrderedDict = OrderedDict()
+        self._tags_cache = (0.0, None)
     
-    def generate_content(self, prompt: str, context: Dict = None, max_tokens: int = None) -> str:
+    def generate_content(self, prompt: str, context: Dict = None, max_tokens: int = None,
+                         system: str = None, max_tweets: int = None) -> str:
         """
         Generate content using DeepSeek via Ollama.
         
@@ -28,43 +188,88 @@ class OllamaService:
             prompt: The main prompt for content generation
             context: Additional context data (posting history, trends, etc.)
             max_tokens: Maximum tokens to generate
+            system: Static system instructions, kept separate so Ollama can cache them
+            max_tweets: Stop generating once this many "Tweet N:" lines are complete
             
         Returns:
             Generated content string
         """
         try:
-            full_prompt = self._build_prompt(prompt, context)
-            
-            payload = {
-                "model": self.model,
-                "prompt": full_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": TEMPERATURE,
-                    "max_tokens": max_tokens or MAX_TOKENS,
-                    "top_p": 0.9,
-                    "repeat_penalty": 1.1
-                }
-            }
+            payload = self._build_payload(prompt, context, max_tokens, system)
             
-            logger.info(f"Generating content with DeepSeek model: {self.model}")
-            response = self.session.post(
+            logger.info("Generating content with DeepSeek model: %s", self.model)
+            parts = []
+            with self.session.post(
                 f"{self.base_url}/api/generate",
-                json=payload
-            )
-            response.raise_for_status()
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
+                stream=True,
+                timeout=REQUEST_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                
+                # Closing the response early aborts the generation on the server
+                for line in response.iter_lines():
+                    if _append_stream_chunk(parts, line, max_tweets):
+                        break
             
-            result = response.json()
-            generated_content = result.get("response", "")
+            generated_content = ''.join(parts)
             
-            logger.info(f"Generated content length: {len(generated_content)} characters")
+            logger.info("Generated content length: %d characters", len(generated_content))
             return generated_content.strip()
             
+        except requests.exceptions.ConnectTimeout as e:
+            logger.error("Timed out connecting to Ollama at %s: %s", self.base_url, e)
+            raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Ollama API: {e}")
+            logger.error("Error calling Ollama API: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error generating content: {e}")
+            logger.error("Error generating content: %s", e)
+            raise
+    
+    async def agenerate_content(self, prompt: str, context: Dict = None, max_tokens: int = None,
+                                system: str = None, max_tweets: int = None) -> str:
+        """
+        Async variant of generate_content using the pooled httpx client.
+        
+        Args:
+            prompt: The main prompt for content generation
+            context: Additional context data (posting history, trends, etc.)
+            max_tokens: Maximum tokens to generate
+            system: Static system instructions, kept separate so Ollama can cache them
+            max_tweets: Stop generating once this many "Tweet N:" lines are complete
+            
+        Returns:
+            Generated content string
+        """
+        try:
+            payload = self._build_payload(prompt, context, max_tokens, system)
+            
+            logger.info("Generating content with DeepSeek model: %s", self.model)
+            parts = []
+            async with self.aclient.stream(
+                "POST", "/api/generate", content=_json_dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if _append_stream_chunk(parts, line, max_tweets):
+                        break
+            
+            generated_content = ''.join(parts)
+            
+            logger.info("Generated content length: %d characters", len(generated_content))
+            return generated_content.strip()
+            
+        except httpx.ConnectTimeout as e:
+            logger.error("Timed out connecting to Ollama at %s: %s", self.base_url, e)
+            raise
+        except httpx.HTTPError as e:
+            logger.error("Error calling Ollama API: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error generating content: %s", e)
             raise
     
     def generate_thread(self, content_type: str, source_data: Dict, context: Dict = None) -> List[str]:
@@ -80,65 +285,240 @@ class OllamaService:
             List of tweet strings for the thread
         """
         try:
-            if content_type == 'news':
-                prompt = self._build_news_prompt(source_data, context)
-            elif content_type == 'bounty':
-                prompt = self._build_bounty_prompt(source_data, context)
-            else:
-                raise ValueError(f"Unknown content type: {content_type}")
+            cache_key = (content_type, _fingerprint(source_data))
+            cached_thread = self._get_cached_thread(cache_key)
+            if cached_thread is not None:
+                return cached_thread
+            
+            prompt = self._build_thread_prompt(content_type, source_data, context)
+            
+            generated_content = self.generate_content(
+                prompt, context, system=_SYSTEM_PROMPTS[content_type], max_tweets=MAX_THREAD_TWEETS
+            )
+            thread = self._parse_thread(generated_content)
+            self._cache_thread(cache_key, thread)
+            
+            logger.info("Generated %d tweets for %s content", len(thread), content_type)
+            return thread
+            
+        except Exception as e:
+            logger.error("Error generating thread: %s", e)
+            raise
+    
+    async def agenerate_thread(self, content_type: str, source_data: Dict, context: Dict = None) -> List[str]:
+        """
+        Async variant of generate_thread; lets several threads be generated concurrently.
+        
+        Args:
+            content_type: 'news' or 'bounty'
+            source_data: The source article or bounty data
+            context: Additional context for generation
+            
+        Returns:
+            List of tweet strings for the thread
+        """
+        try:
+            cache_key = (content_type, _fingerprint(source_data))
+            cached_thread = self._get_cached_thread(cache_key)
+            if cached_thread is not None:
+                return cached_thread
             
-            generated_content = self.generate_content(prompt, context)
+            prompt = self._build_thread_prompt(content_type, source_data, context)
+            
+            generated_content = await self.agenerate_content(
+                prompt, context, system=_SYSTEM_PROMPTS[content_type], max_tweets=MAX_THREAD_TWEETS
+            )
             thread = self._parse_thread(generated_content)
+            self._cache_thread(cache_key, thread)
             
-            logger.info(f"Generated {len(thread)} tweets for {content_type} content")
+            logger.info("Generated %d tweets for %s content", len(thread), content_type)
             return thread
             
         except Exception as e:
-            logger.error(f"Error generating thread: {e}")
+            logger.error("Error generating thread: %s", e)
             raise
     
+    async def agenerate_threads_batch(
+        self, items: List[Tuple[str, Dict, Optional[Dict]]]
+    ) -> List[Union[List[str], Exception]]:
+        """
+        Generate several threads at once, keeping up to max_parallel requests in flight.
+        
+        Submitting them together lets an Ollama server started with
+        OLLAMA_NUM_PARALLEL > 1 work on them side by side instead of one by one.
+        
+        Args:
+            items: (content_type, source_data, context) tuples
+            
+        Returns:
+            One entry per item, in order: the thread, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        
+        async def generate(content_type: str, source_data: Dict, context: Optional[Dict]) -> List[str]:
+            async with semaphore:
+                return await self.agenerate_thread(content_type, source_data, context)
+        
+        # Items share the plan's history/engagement objects; render each once per batch
+        token = _context_json_memo.set({})
+        try:
+            return await asyncio.gather(
+                *[generate(content_type, source_data, context) for content_type, source_data, context in items],
+                return_exceptions=True
+            )
+        finally:
+            _context_json_memo.reset(token)
+    
+    def _get_cached_thread(self, key: tuple) -> Optional[List[str]]:
+        """Return a copy of a cached thread for key, or None if missing or expired."""
+        entry = self._thread_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, thread = entry
+        if time.monotonic() - cached_at > THREAD_CACHE_TTL_SECONDS:
+            del self._thread_cache[key]
+            return None
+        
+        self._thread_cache.move_to_end(key)
+        logger.info("Reusing cached thread for %s content", key[0])
+        return list(thread)
+    
+    def _cache_thread(self, key: tuple, thread: List[str]):
+        """Store a generated thread, evicting the least recently used entry when full."""
+        if not thread:
+            return
+        
+        self._thread_cache[key] = (time.monotonic(), tuple(thread))
+        self._thread_cache.move_to_end(key)
+        if len(self._thread_cache) > THREAD_CACHE_MAX_ENTRIES:
+            self._thread_cache.popitem(last=False)
+    
+    def warm_up(self) -> bool:
+        """
+        Load the model and evaluate each static system prompt ahead of real traffic.
+        
+        Sends a one-token generation per system prompt, so the first thread of the
+        day doesn't pay for the model load and the system prompt's prefix is
+        already cached by Ollama.
+        
+        Returns:
+            True if every warm-up request succeeded, False otherwise
+        """
+        try:
+            for content_type, system in _SYSTEM_PROMPTS.items():
+                response = self.session.post(
+                    f"{self.base_url}/api/generate",
+                    data=_json_dumps({
+                        "model": self.model,
+                        "system": system,
+                        "prompt": "\n",
+                        "stream": False,
+                        "keep_alive": KEEP_ALIVE,
+                        "options": {"num_predict": 1}
+                    }),
+                    headers=_JSON_HEADERS,
+                    timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                logger.info("Warmed up %s with the %s system prompt", self.model, content_type)
+            return True
+            
+        except Exception as e:
+            logger.warning("Ollama warm-up failed: %s", e)
+            return False
+    
+    async def aclose(self):
+        """Close the pooled async HTTP client."""
+        await self.aclient.aclose()
+    
+    def _build_payload(self, prompt: str, context: Dict = None, max_tokens: int = None,
+                       system: str = None) -> Dict:
+        """Build the /api/generate request body."""
+        payload = {
+            "model": self.model,
+            "prompt": self._build_prompt(prompt, context),
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
+            "options": {
+                "temperature": TEMPERATURE,
+                "max_tokens": max_tokens or MAX_TOKENS,
+                "top_p": 0.9,
+                "repeat_penalty": 1.1
+            }
+        }
+        if system:
+            payload["system"] = system
+        return payload
+    
+    def _build_thread_prompt(self, content_type: str, source_data: Dict, context: Dict = None) -> str:
+        """Select and build the prompt for the given content type."""
+        if content_type == 'news':
+            return self._build_news_prompt(source_data, context)
+        elif content_type == 'bounty':
+            return self._build_bounty_prompt(source_data, context)
+        else:
+            raise ValueError(f"Unknown content type: {content_type}")
+    
     def _build_prompt(self, prompt: str, context: Dict = None) -> str:
         """Build context-aware prompt for the LLM."""
         context_str = ""
         if context:
-            context_str = f"\n\nContext Information:\n{json.dumps(context, indent=2)}"
+            context_str = f"\n\nContext Information:\n{self._render_context(context)}"
         
         return f"{prompt}{context_str}"
     
+    def _render_context(self, context: Dict) -> str:
+        """
+        Render context as two-space indented JSON.
+        
+        Every item in a batch shares the same posting history and engagement
+        objects, so within a batch nested lists/dicts are serialized once and reused.
+        """
+        entries = []
+        for key, value in context.items():
+            if isinstance(value, (dict, list)) and value:
+                rendered = self._render_context_value(value)
+            else:
+                rendered = _json_dumps_indented(value)
+            entries.append(f'  {_json_dumps_indented(str(key))}: {rendered}')
+        
+        return '{\n' + ',\n'.join(entries) + '\n}'
+    
+    def _render_context_value(self, value) -> str:
+        """Return the nested (two-space indented) JSON for a shared context value."""
+        memo = _context_json_memo.get()
+        if memo is not None:
+            entry = memo.get(id(value))
+            # The entry holds a reference to value, so a matching id is the same object
+            if entry is not None and entry[0] is value:
+                return entry[1]
+        
+        rendered = _json_dumps_indented(value).replace('\n', '\n  ')
+        if memo is not None:
+            memo[id(value)] = (value, rendered)
+        return rendered
+    
     def _build_news_prompt(self, article: Dict, context: Dict = None) -> str:
-        """Build prompt for news content generation."""
+        """Build the article-specific part of the news prompt (instructions live in NEWS_SYSTEM_PROMPT)."""
         title = article.get('title', '')
         content = article.get('content', '')
         source = article.get('source', '')
         category = article.get('category', '')
         
         prompt = f"""
-You are a crypto news bot that creates engaging Twitter threads about cryptocurrency and Web3 news.
-
 Article Information:
 - Title: {title}
 - Source: {source}
 - Category: {category}
 - Content: {content[:1000]}...
 
-Create a Twitter thread (3-6 tweets) that:
-1. Captures the key points of the news
-2. Explains why it matters to the crypto community
-3. Uses engaging language and relevant hashtags
-4. Maintains a professional but accessible tone
-5. Includes a call-to-action for engagement
-
-Format each tweet on a new line, starting with "Tweet 1:", "Tweet 2:", etc.
-Keep each tweet under 280 characters.
-Use relevant crypto hashtags but don't overuse them.
-Make it engaging and shareable.
-
 Thread:
 """
         return prompt
     
     def _build_bounty_prompt(self, bounty: Dict, context: Dict = None) -> str:
-        """Build prompt for bounty content generation."""
+        """Build the bounty-specific part of the bounty prompt (instructions live in BOUNTY_SYSTEM_PROMPT)."""
         title = bounty.get('title', '')
         description = bounty.get('description', '')
         reward = bounty.get('reward_amount', '')
@@ -147,8 +527,6 @@ Thread:
         category = bounty.get('category', '')
         
         prompt = f"""
-You are a crypto bounty bot that creates engaging Twitter threads about bounty opportunities.
-
 Bounty Information:
 - Title: {title}
 - Description: {description}
@@ -156,81 +534,67 @@ Bounty Information:
 - Deadline: {deadline}
 - Category: {category}
 
-Create a Twitter thread (3-4 tweets) that:
-1. Introduces the bounty opportunity naturally
-2. Explains what skills are needed
-3. Highlights the reward and deadline
-4. Encourages qualified developers to apply
-5. Feels organic and not spammy
-
-Format each tweet on a new line, starting with "Tweet 1:", "Tweet 2:", etc.
-Keep each tweet under 280 characters.
-Use relevant hashtags but keep it natural.
-Make it appealing to developers and builders.
-
 Thread:
 """
         return prompt
     
     def _parse_thread(self, content: str) -> List[str]:
         """Parse generated content into individual tweets."""
-        tweets = []
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('Tweet ') and ':' in line:
-                # Extract tweet content after "Tweet X:"
-                tweet_content = line.split(':', 1)[1].strip()
-                if tweet_content and len(tweet_content) <= 280:
-                    tweets.append(tweet_content)
-            elif line and not line.startswith('Tweet ') and len(line) <= 280:
-                # Handle case where tweets aren't prefixed
-                tweets.append(line)
+        # Prefer "Tweet N:" lines; fall back to every line when the model didn't number them
+        tweets = _TWEET_LINE_RE.findall(content) or [line.strip() for line in content.split('\n')]
         
         # Filter out empty tweets and ensure they're within limits
-        valid_tweets = []
-        for tweet in tweets:
-            if tweet and len(tweet) <= 280:
-                valid_tweets.append(tweet)
+        return [tweet for tweet in tweets if 0 < len(tweet) <= 280][:MAX_THREAD_TWEETS]
+    
+    def _fetch_tags(self) -> frozenset:
+        """
+        Return the names of the models Ollama has available.
+        
+        Successful listings are cached for TAGS_CACHE_TTL_SECONDS; errors propagate.
+        """
+        cached_at, model_names = self._tags_cache
+        if model_names is not None and time.monotonic() - cached_at < TAGS_CACHE_TTL_SECONDS:
+            return model_names
+        
+        response = self.session.get(f"{self.base_url}/api/tags", timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
         
-        return valid_tweets[:6]  # Maximum 6 tweets per thread
+        models = _json_loads(response.content).get('models', [])
+        model_names = frozenset(model['name'] for model in models)
+        self._tags_cache = (time.monotonic(), model_names)
+        return model_names
     
     def test_connection(self) -> bool:
         """Test connection to Ollama service."""
         try:
-            response = self.session.get(f"{self.base_url}/api/tags")
-            response.raise_for_status()
-            
-            models = response.json().get('models', [])
-            model_names = [model['name'] for model in models]
+            model_names = self._fetch_tags()
             
             if self.model in model_names:
-                logger.info(f"Ollama connection successful, model {self.model} available")
+                logger.info("Ollama connection successful, model %s available", self.model)
                 return True
             else:
-                logger.warning(f"Model {self.model} not found. Available models: {model_names}")
+                logger.warning("Model %s not found. Available models: %s", self.model, sorted(model_names))
                 return False
                 
         except Exception as e:
-            logger.error(f"Ollama connection test failed: {e}")
+            logger.error("Ollama connection test failed: %s", e)
             return False
     
     def get_available_models(self) -> List[str]:
         """Get list of available models from Ollama."""
         try:
-            response = self.session.get(f"{self.base_url}/api/tags")
-            response.raise_for_status()
-            
-            models = response.json().get('models', [])
-            return [model['name'] for model in models]
+            return sorted(self._fetch_tags())
             
         except Exception as e:
-            logger.error(f"Error getting available models: {e}")
+            logger.error("Error getting available models: %s", e)
             return []
 
+@lru_cache(maxsize=1)
+def _default_ollama_service() -> OllamaService:
+    """Return the shared Ollama service so its connection pool and caches are reused."""
+    return OllamaService()
+
 # Convenience function for backward compatibility
 def generate_content(prompt: str, context: Dict = None) -> str:
     """Generate content using the default Ollama service."""
-    service = OllamaService()
-    return service.generate_content(prompt, context)
+    return _default_ollama_service().generate_content(prompt, context)
@@ -4,10 +4,12 @@ Coordinates scraping, deduplication, thread generation, and posting.
 """
 import os
 import sys
-import time
+import asyncio
 import logging
+import time
 from datetime import datetime
-from apscheduler.schedulers.blocking import BlockingScheduler
+from typing import Optional
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 # Add src directory to path for imports
@@ -20,8 +22,9 @@ from .config import (
 from .scraper import BountyScraper
 from .generator import ThreadGenerator
 from .poster import TwitterPoster
+from .content_generator import warm_up
 from .storage import (
-    init_db, is_bounty_seen, mark_bounty_seen, record_post,
+    init_db, filter_unseen, mark_bounty_seen, record_posts,
     get_daily_post_count, get_recent_posts
 )
 from .utils import log_with_context
@@ -65,11 +68,22 @@ class BountyBot:
     
     def run_scheduler(self):
         """Run the main scheduler loop."""
-        logger.info(f"Starting bounty bot scheduler (interval: {POST_INTERVAL_MINUTES} minutes)")
+        try:
+            asyncio.run(self.run_scheduler_async())
+        except KeyboardInterrupt:
+            logger.info("Scheduler stopped by user")
+    
+    async def run_scheduler_async(self):
+        """
+        Run the scheduler on the current event loop.
+        
+        Jobs share this loop, so HTTP connection pools stay alive between cycles.
+        """
+        logger.info("Starting bounty bot scheduler (interval: %s minutes)", POST_INTERVAL_MINUTES)
         
-        scheduler = BlockingScheduler()
+        scheduler = AsyncIOScheduler()
         
-        # Add the main job
+        # Add the main job (coroutine jobs are awaited on the scheduler's loop)
         scheduler.add_job(
             func=self.check_and_post_bounties,
             trigger=IntervalTrigger(minutes=POST_INTERVAL_MINUTES),
@@ -92,42 +106,36 @@ class BountyBot:
         try:
             self.is_running = True
             scheduler.start()
-        except KeyboardInterrupt:
-            logger.info("Scheduler stopped by user")
+            await asyncio.Event().wait()
         except Exception as e:
-            logger.error(f"Scheduler error: {e}")
+            logger.error("Scheduler error: %s", e)
             raise
         finally:
+            scheduler.shutdown(wait=False)
             self.is_running = False
     
-    def check_and_post_bounties(self):
+    async def check_and_post_bounties(self):
         """Main job: check for new bounties and post threads."""
         try:
             log_with_context(logging.INFO, "Starting bounty check cycle")
             
-            # Check daily post limit
-            daily_count = get_daily_post_count()
+            # Check daily post limit. Storage calls block (SQLite, or Supabase over the network),
+            # so they run in worker threads, each with its own SQLite connection
+            daily_count = await asyncio.to_thread(get_daily_post_count)
             if daily_count >= MAX_POSTS_PER_DAY:
                 log_with_context(logging.INFO, "Daily post limit reached", 
                                daily_count=daily_count, max_posts=MAX_POSTS_PER_DAY)
                 return
             
             # Fetch new bounties (use Playwright for JavaScript-heavy sites)
-            bounties = self.scraper.fetch_bounties(use_playwright=True)
+            bounties = await self.scraper.afetch_bounties(use_playwright=True)
             log_with_context(logging.INFO, "Fetched bounties", count=len(bounties))
             
-            # Process each bounty
-            new_bounties = []
-            for bounty in bounties:
-                bounty_id = bounty.get('id')
-                if not bounty_id:
-                    continue
-                
-                # Check if we've already seen this bounty
-                if is_bounty_seen(bounty_id):
-                    continue
-                
-                new_bounties.append(bounty)
+            # Drop bounties we've already seen (one bulk lookup for all ids)
+            unseen_ids = set(await asyncio.to_thread(
+                filter_unseen, [bounty['id'] for bounty in bounties if bounty.get('id')]
+            ))
+            new_bounties = [bounty for bounty in bounties if bounty.get('id') in unseen_ids]
             
             log_with_context(logging.INFO, "Found new bounties", count=len(new_bounties))
             
@@ -135,76 +143,106 @@ class BountyBot:
             remaining_posts = MAX_POSTS_PER_DAY - daily_count
             bounties_to_process = new_bounties[:remaining_posts]
             
-            for bounty in bounties_to_process:
+            # Start generating every thread now; each one is posted (in order) as soon
+            # as it is ready, while the remaining generations keep running
+            generation_tasks = [
+                asyncio.create_task(self.generator.agenerate_thread(bounty))
+                for bounty in bounties_to_process
+            ]
+            
+            # Seen marks are written per bounty (see below); post records are buffered
+            # and written in one transaction when the loop ends, however it ends
+            post_rows = []
+            try:
+                for bounty, generation_task in zip(bounties_to_process, generation_tasks):
+                    try:
+                        thread = await generation_task
+                        
+                        post_row = await self._process_bounty(bounty, thread)
+                        if post_row:
+                            post_rows.append(post_row)
+                        
+                        # Mark as seen straight away, so a crash later in the cycle
+                        # can never lead to this bounty being posted again
+                        await asyncio.to_thread(
+                            mark_bounty_seen,
+                            bounty['id'],
+                            bounty['title'],
+                            bounty['url'],
+                            bounty.get('description', '')
+                        )
+                        
+                        # Small delay between posts
+                        await asyncio.sleep(30)
+                        
+                    except Exception as e:
+                        log_with_context(logging.ERROR, "Failed to process bounty", 
+                                       bounty_id=bounty.get('id'), error=str(e))
+                        continue
+            finally:
+                # The threads are already live; a failed record must not abort the cycle
                 try:
-                    self._process_bounty(bounty)
-                    
-                    # Mark as seen
-                    mark_bounty_seen(
-                        bounty['id'],
-                        bounty['title'],
-                        bounty['url'],
-                        bounty.get('description', '')
-                    )
-                    
-                    # Small delay between posts
-                    time.sleep(30)
-                    
+                    if post_rows:
+                        await asyncio.to_thread(record_posts, post_rows)
                 except Exception as e:
-                    log_with_context(logging.ERROR, "Failed to process bounty", 
-                                   bounty_id=bounty.get('id'), error=str(e))
-                    continue
+                    log_with_context(logging.ERROR, "Failed to record posts",
+                                   count=len(post_rows), error=str(e))
             
             log_with_context(logging.INFO, "Bounty check cycle completed")
             
         except Exception as e:
             log_with_context(logging.ERROR, "Error in bounty check cycle", error=str(e))
     
-    def _process_bounty(self, bounty: dict):
-        """Process a single bounty: generate thread and post."""
+    async def _process_bounty(self, bounty: dict, thread: list) -> Optional[tuple]:
+        """
+        Process a single bounty: post its generated thread.
+        
+        Returns:
+            The (bounty_id, root_tweet_id, tweet_ids, posted_at) row to record, or None
+        """
         try:
             bounty_id = bounty['id']
             log_with_context(logging.INFO, "Processing bounty", bounty_id=bounty_id, title=bounty['title'])
             
-            # Generate thread
-            thread = self.generator.generate_thread(bounty)
             if not thread:
                 log_with_context(logging.WARNING, "Failed to generate thread", bounty_id=bounty_id)
-                return
+                return None
             
             log_with_context(logging.INFO, "Generated thread", bounty_id=bounty_id, tweet_count=len(thread))
             
             # Post thread
-            result = self.poster.post_thread(thread)
+            result = await self.poster.apost_thread(thread)
             if result['success']:
-                # Record the post
-                record_post(
+                log_with_context(logging.INFO, "Successfully posted bounty thread", 
+                               bounty_id=bounty_id, root_tweet_id=result['root_tweet_id'])
+                
+                # Row for the post record
+                return (
                     bounty_id,
                     result['root_tweet_id'],
-                    result['tweet_ids']
+                    result['tweet_ids'],
+                    result.get('posted_at') or int(time.time())
                 )
-                
-                log_with_context(logging.INFO, "Successfully posted bounty thread", 
-                               bounty_id=bounty_id, root_tweet_id=result['root_tweet_id'])
-            else:
-                log_with_context(logging.ERROR, "Failed to post thread", bounty_id=bounty_id)
+            
+            log_with_context(logging.ERROR, "Failed to post thread", bounty_id=bounty_id)
+            return None
                 
         except Exception as e:
             log_with_context(logging.ERROR, "Error processing bounty", 
                            bounty_id=bounty.get('id'), error=str(e))
             raise
     
-    def daily_reset(self):
+    async def daily_reset(self):
         """Daily reset and cleanup tasks."""
         try:
             log_with_context(logging.INFO, "Running daily reset")
             
             # Log daily statistics
-            recent_posts = get_recent_posts(24)  # Last 24 hours
+            recent_posts = await asyncio.to_thread(get_recent_posts, 24)  # Last 24 hours
             log_with_context(logging.INFO, "Daily statistics", posts_count=len(recent_posts))
             
             # Test connections
-            self._test_connections()
+            await asyncio.to_thread(self._test_connections)
             
             log_with_context(logging.INFO, "Daily reset completed")
             
@@ -214,30 +252,43 @@ class BountyBot:
     def run_once(self):
         """Run a single check cycle (useful for testing)."""
         logger.info("Running single bounty check cycle")
-        self.check_and_post_bounties()
+        asyncio.run(self.check_and_post_bounties())
         logger.info("Single check cycle completed")
 
-def main():
-    """Main entry point."""
+async def main_async():
+    """Async entry point: the bot and its scheduler share a single event loop."""
+    # Validate configuration
+    validate_config()
+    
+    # Create and run bot
+    bot = BountyBot()
+    
+    # Load the LLM and its system prompts before the first cycle (off the event loop;
+    # a failed warm-up is logged and the bot carries on)
+    await asyncio.to_thread(warm_up)
+    
     try:
-        # Validate configuration
-        validate_config()
-        
-        # Create and run bot
-        bot = BountyBot()
-        
         # Check command line arguments
         if len(sys.argv) > 1 and sys.argv[1] == '--once':
             # Run once for testing
-            bot.run_once()
+            logger.info("Running single bounty check cycle")
+            await bot.check_and_post_bounties()
+            logger.info("Single check cycle completed")
         else:
             # Run scheduler
-            bot.run_scheduler()
-            
+            await bot.run_scheduler_async()
+    finally:
+        # Shut down the scraper's reusable browser
+        bot.scraper.close()
+
+def main():
+    """Main entry point."""
+    try:
+        asyncio.run(main_async())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Bot error: {e}")
+        logger.error("Bot error: %s", e)
         sys.exit(1)
 
 if __name__ == '__main__':
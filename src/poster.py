@@ -3,17 +3,24 @@ Twitter/X posting functionality for the Twitter Bounty Bot.
 Handles posting threads via the Twitter API.
 """
 import tweepy
+import asyncio
 import logging
 import time
+from time import sleep
+from functools import lru_cache
 from typing import List, Dict, Optional
 from .config import (
     TW_API_KEY, TW_API_SECRET, TW_ACCESS_TOKEN, TW_ACCESS_SECRET,
     TW_BEARER_TOKEN, MAX_TWEET_LENGTH
 )
-from .utils import exponential_backoff, log_with_context, rate_limit_check
+from .utils import TRANSIENT_ERRORS, exponential_backoff, log_with_context, rate_limit_check
 
 logger = logging.getLogger(__name__)
 
+# Posting failures worth retrying: network errors, rate limits, and Twitter-side 5xx.
+# Auth, permission, and validation errors fail the same way every time.
+_RETRYABLE_ERRORS = TRANSIENT_ERRORS + (tweepy.TooManyRequests, tweepy.TwitterServerError)
+
 class TwitterPoster:
     """Handles posting to Twitter/X using the Twitter API v2."""
     
@@ -53,7 +60,7 @@ class TwitterPoster:
             log_with_context(logging.ERROR, "Failed to setup Twitter client", error=str(e))
             raise
     
-    @exponential_backoff(max_retries=3)
+    @exponential_backoff(max_retries=3, retry_on=_RETRYABLE_ERRORS)
     def post_thread(self, thread: List[str]) -> Dict:
         """
         Post a thread of tweets to Twitter.
@@ -74,7 +81,7 @@ class TwitterPoster:
         if not rate_limit_check(self.last_post_time):
             wait_time = 60 - (time.time() - self.last_post_time)
             log_with_context(logging.WARNING, "Rate limit check failed, waiting", wait_seconds=wait_time)
-            time.sleep(wait_time)
+            sleep(wait_time)
         
         try:
             log_with_context(logging.INFO, "Posting thread", tweet_count=len(thread))
@@ -93,7 +100,7 @@ class TwitterPoster:
                     in_reply_to_id = reply_tweet.id
                     
                     # Small delay between tweets in the thread
-                    time.sleep(1)
+                    sleep(1)
                     
                 except Exception as e:
                     log_with_context(logging.ERROR, f"Failed to post tweet {i+1} in thread", 
@@ -120,6 +127,20 @@ class TwitterPoster:
             log_with_context(logging.ERROR, "Failed to post thread", error=str(e))
             raise
     
+    async def apost_thread(self, thread: List[str]) -> Dict:
+        """
+        Async variant of post_thread.
+        Posting (including the delays between tweets) runs in a worker thread
+        so the event loop keeps generating other threads meanwhile.
+        
+        Args:
+            thread: List of tweet texts to post as a thread
+            
+        Returns:
+            Dictionary with thread information and tweet IDs
+        """
+        return await asyncio.to_thread(self.post_thread, thread)
+    
     def _post_tweet(self, text: str, in_reply_to_id: Optional[int] = None):
         """
         Post a single tweet.
@@ -147,7 +168,7 @@ class TwitterPoster:
             
         except tweepy.TooManyRequests:
             log_with_context(logging.WARNING, "Rate limit exceeded, waiting...")
-            time.sleep(900)  # Wait 15 minutes
+            sleep(900)  # Wait 15 minutes
             raise
         except tweepy.Unauthorized:
             log_with_context(logging.ERROR, "Twitter API unauthorized - check credentials")
@@ -198,6 +219,11 @@ class TwitterPoster:
             log_with_context(logging.ERROR, "Failed to get rate limit status", error=str(e))
             return {'error': str(e)}
 
+@lru_cache(maxsize=1)
+def _default_poster() -> TwitterPoster:
+    """Return the shared poster, authenticating on first use only."""
+    return TwitterPoster()
+
 # Convenience function for backward compatibility
 def post_thread(thread: List[str]) -> Dict:
     """
@@ -209,5 +235,4 @@ def post_thread(thread: List[str]) -> Dict:
     Returns:
         Dictionary with thread information and tweet IDs
     """
-    poster = TwitterPoster()
-    return poster.post_thread(thread)
+    return _default_poster().post_thread(thread)
@@ -2,34 +2,205 @@
 Bounty site scraper for the Twitter Bounty Bot.
 Handles fetching and parsing bounty data from target websites.
 """
+import asyncio
+import hashlib
 import requests
+import httpx
 import time
 import logging
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Optional, Union
+from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright
 from .config import BOUNTY_SITE_URL
 from .utils import get_user_agent, log_with_context
 
 logger = logging.getLogger(__name__)
 
+# Elements that look like bounty cards, matched in one pass over the tree
+_BOUNTY_SELECTOR = ', '.join((
+    # Elements with classes containing bounty-related words
+    '[class*="bounty"]', '[class*="task"]', '[class*="job"]', '[class*="opportunity"]',
+    '[class*="thread"]', '[class*="twitter"]', '[class*="social"]', '[class*="post"]',
+    # Generic card/item selectors
+    '.card', '.item', '.post', '.bounty', '.task', '.job'
+))
+
+# Containers also count when their text mentions one of these words
+# (lexbor has no :contains(), so this is checked on each element's text)
+_TEXT_MATCH_SELECTOR = 'div, article'
+_TEXT_MATCH_KEYWORDS = ('thread', 'twitter', 'bounty')
+
+# Browser-like headers sent with every page request
+_REQUEST_HEADERS = {
+    'User-Agent': get_user_agent(),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# Descriptions are cut to this length at ingest; downstream prompts and tweets use far less
+MAX_DESCRIPTION_LENGTH = 1200
+
+# Page text that marks an element as a bounty candidate in the browser
+_PLAYWRIGHT_KEYWORDS = [
+    'thread', 'twitter', 'bounty', 'task', 'job', 'opportunity', 'social', 'post',
+    'content', 'writing', 'article', 'blog', 'tweet', 'marketing', 'promotion',
+]
+
+# Page text that marks an element as navigation, header, or inline CSS
+_PLAYWRIGHT_NAVIGATION_WORDS = [
+    'login', 'sign up', 'become a sponsor', 'nprogress', 'pointer-events',
+    'background:', 'filter', 'sort', 'category', 'status',
+]
+
+# In-page extraction script, evaluated once per scrape with the arguments below
+_EXTRACT_BOUNTIES_JS = """
+    ({keywords, navigationWords, maxDescriptionLength}) => {
+        // One case-insensitive pass per element instead of a lowercased copy per keyword
+        const keywordRe = new RegExp(keywords.join('|'), 'i');
+        const navigationRe = new RegExp(navigationWords.join('|'), 'i');
+        const bountyElements = [];
+        const seenHrefs = new Set();
+        
+        // Start from links (far fewer than containers) and walk up to the card around each
+        for (const link of document.querySelectorAll('a[href]')) {
+            const href = link.href;
+            if (!href || href.includes('javascript:') || seenHrefs.has(href)) {
+                continue;
+            }
+            
+            // Filter out navigation, header, and CSS elements
+            if (link.closest('nav, header, .nav, .header, .filter, .sort')) {
+                continue;
+            }
+            
+            // Nearest container with enough text to be a bounty
+            let host = link.closest('div, article, section, li');
+            while (host && host.textContent.trim().length <= 20) {
+                host = host.parentElement && host.parentElement.closest('div, article, section, li');
+            }
+            if (!host) {
+                continue;
+            }
+            
+            const text = host.textContent;
+            if (!keywordRe.test(text) || navigationRe.test(text)) {
+                continue;
+            }
+            
+            const elementText = text.trim();
+            seenHrefs.add(href);
+            bountyElements.push({
+                href: href,
+                title: link.textContent.trim() || elementText,
+                description: elementText.slice(0, maxDescriptionLength)
+            });
+            if (bountyElements.length === 20) {
+                break;  // Limit to first 20 results
+            }
+        }
+        
+        return bountyElements;
+    }
+"""
+
+_EXTRACT_BOUNTIES_ARGS = {
+    'keywords': _PLAYWRIGHT_KEYWORDS,
+    'navigationWords': _PLAYWRIGHT_NAVIGATION_WORDS,
+    'maxDescriptionLength': MAX_DESCRIPTION_LENGTH,
+}
+
+def _response_html(response) -> Union[str, bytes]:
+    """
+    Return a response body for the HTML parser.
+    
+    UTF-8 bodies are handed over as raw bytes (lexbor decodes them natively), which skips
+    building a decoded str copy of the page. Other charsets still go through .text, since
+    lexbor assumes UTF-8 for byte input.
+    """
+    encoding = response.encoding
+    if isinstance(encoding, str) and encoding.lower().replace('_', '-') in ('utf-8', 'utf8'):
+        return response.content
+    return response.text
+
+@lru_cache(maxsize=1024)
+def _title_hash_id(title: str) -> str:
+    """Return the 12-hex-char id for a title; repeat scrapes hit the cache."""
+    # Must stay MD5[:12]: these ids are stored in seen_bounty, and any other
+    # scheme would make every previously seen bounty look new and be re-posted
+    return hashlib.md5(title.encode()).hexdigest()[:12]
+
+@lru_cache(maxsize=1)
+def _default_session() -> requests.Session:
+    """Return the shared HTTP session, so every scraper reuses one connection pool."""
+    session = requests.Session()
+    session.headers.update(_REQUEST_HEADERS)
+    return session
+
 class BountyScraper:
-    """Scraper for bounty sites using requests/BeautifulSoup or Playwright."""
+    """Scraper for bounty sites using requests/selectolax or Playwright."""
     
     def __init__(self, site_url: str = None):
         self.site_url = site_url or BOUNTY_SITE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': get_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        self.session = _default_session()
+        # Playwright's sync objects belong to the thread that created them (and refuse
+        # to run inside an event loop), so the browser lives on one dedicated thread
+        self._browser_executor: Optional[ThreadPoolExecutor] = None
+        self._playwright = None
+        self._browser = None
+        self._browser_context = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Shut down the shared browser, if one was started."""
+        if self._browser_executor is None:
+            return
+        
+        self._browser_executor.submit(self._close_browser).result()
+        self._browser_executor.shutdown()
+        self._browser_executor = None
+    
+    def _get_browser_executor(self) -> ThreadPoolExecutor:
+        """Return the single worker thread that owns the browser."""
+        if self._browser_executor is None:
+            self._browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+        return self._browser_executor
+    
+    def _get_browser_context(self):
+        """Launch the browser on first use and return its shared context (browser thread only)."""
+        if self._browser_context is None:
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._browser_context = self._browser.new_context(user_agent=get_user_agent())
+            self._browser_context.set_default_timeout(15000)
+        return self._browser_context
+    
+    def _close_browser(self):
+        """Close the context, browser, and Playwright driver (browser thread only)."""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception as e:
+            log_with_context(logging.WARNING, "Error closing Playwright browser", error=str(e))
+        finally:
+            self._playwright = None
+            self._browser = None
+            self._browser_context = None
     
     def fetch_bounties_requests(self) -> List[Dict]:
         """
-        Fetch bounties using requests and BeautifulSoup.
+        Fetch bounties using requests and selectolax (lexbor).
         Use this for sites with server-side rendered content.
         
         Returns:
@@ -40,67 +211,7 @@ class BountyScraper:
             response = self.session.get(self.site_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            bounties = []
-            
-            # Look for elements containing 'thread', 'twitter', or similar bounty-related terms
-            bounty_elements = []
-            
-            # Try multiple selectors for different site structures
-            selectors = [
-                # Look for elements with classes containing bounty-related words
-                '[class*="bounty"]', '[class*="task"]', '[class*="job"]', '[class*="opportunity"]',
-                '[class*="thread"]', '[class*="twitter"]', '[class*="social"]', '[class*="post"]',
-                # Look for elements with text content containing these words
-                'div:contains("thread")', 'div:contains("twitter")', 'div:contains("bounty")',
-                'article:contains("thread")', 'article:contains("twitter")', 'article:contains("bounty")',
-                # Generic card/item selectors
-                '.card', '.item', '.post', '.bounty', '.task', '.job'
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = soup.select(selector)
-                    bounty_elements.extend(elements)
-                except:
-                    continue
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            bounty_elements = [elem for elem in bounty_elements if elem not in seen and not seen.add(elem)]
-            
-            for element in bounty_elements:
-                try:
-                    # Extract bounty data - customize these selectors
-                    link = element.select_one('a')
-                    if not link:
-                        continue
-                    
-                    href = link.get('href', '')
-                    if not href.startswith('http'):
-                        href = self.site_url.rstrip('/') + '/' + href.lstrip('/')
-                    
-                    title = link.get_text(strip=True)
-                    bounty_id = self._extract_bounty_id(href, title)
-                    
-                    # Try to extract description
-                    description = ''
-                    desc_element = element.select_one('.description, .summary, .bounty-desc')
-                    if desc_element:
-                        description = desc_element.get_text(strip=True)
-                    
-                    if bounty_id and title:
-                        bounties.append({
-                            'id': bounty_id,
-                            'title': title,
-                            'url': href,
-                            'description': description,
-                            'scraped_at': int(time.time())
-                        })
-                        
-                except Exception as e:
-                    log_with_context(logging.WARNING, "Error parsing bounty element", error=str(e))
-                    continue
+            bounties = self._parse_bounties(_response_html(response), self.site_url)
             
             log_with_context(logging.INFO, "Successfully scraped bounties", count=len(bounties))
             return bounties
@@ -112,29 +223,145 @@ class BountyScraper:
             log_with_context(logging.ERROR, "Unexpected error in scraper", error=str(e))
             raise
     
+    def _parse_bounties(self, html: Union[str, bytes], base_url: str) -> List[Dict]:
+        """
+        Extract bounties from a page's HTML.
+        
+        Args:
+            html: Page markup (str, or UTF-8 bytes)
+            base_url: URL that relative links are resolved against
+            
+        Returns:
+            List of bounty dictionaries with id, title, url, description
+        """
+        tree = LexborHTMLParser(html)
+        # Keyed by bounty id: nested containers around the same link yield the same bounty
+        bounties = {}
+        
+        # Look for elements containing 'thread', 'twitter', or similar bounty-related terms
+        bounty_elements = tree.css(_BOUNTY_SELECTOR)
+        bounty_elements.extend(
+            elem for elem in tree.css(_TEXT_MATCH_SELECTOR)
+            if any(keyword in elem.text() for keyword in _TEXT_MATCH_KEYWORDS)
+        )
+        
+        # Remove duplicates (an element can match several selectors) while preserving order
+        bounty_elements = list(dict.fromkeys(bounty_elements))
+        
+        for element in bounty_elements:
+            try:
+                # Extract bounty data - customize these selectors
+                link = element.css_first('a')
+                if not link:
+                    continue
+                
+                # Resolve relative links the way a browser would (absolute links pass through)
+                href = urljoin(base_url, link.attributes.get('href') or '')
+                
+                title = link.text(strip=True)
+                bounty_id = self._extract_bounty_id(href, title)
+                
+                # Try to extract description
+                description = ''
+                desc_element = element.css_first('.description, .summary, .bounty-desc')
+                if desc_element:
+                    description = desc_element.text(strip=True)[:MAX_DESCRIPTION_LENGTH]
+                
+                if bounty_id and title and bounty_id not in bounties:
+                    bounties[bounty_id] = {
+                        'id': bounty_id,
+                        'title': title,
+                        'url': href,
+                        'description': description,
+                        'scraped_at': int(time.time())
+                    }
+                    
+            except Exception as e:
+                log_with_context(logging.WARNING, "Error parsing bounty element", error=str(e))
+                continue
+        
+        return list(bounties.values())
+    
+    async def afetch_bounties_requests(self, urls: List[str] = None) -> List[Dict]:
+        """
+        Fetch and parse several pages concurrently over one pooled async HTTP/2 client.
+        
+        Args:
+            urls: Pages to scrape (sites or paginated listings); defaults to site_url
+            
+        Returns:
+            Bounties from every page that loaded, in page order
+        """
+        urls = urls or [self.site_url]
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers), timeout=15, follow_redirects=True, http2=True
+        ) as client:
+            pages = await asyncio.gather(
+                *[self._afetch_page(client, url) for url in urls],
+                return_exceptions=True
+            )
+        
+        # Keyed by bounty id so a bounty listed on several pages is returned once
+        bounties = {}
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                log_with_context(logging.ERROR, "Failed to fetch bounties", site_url=url, error=str(page))
+                continue
+            for bounty in self._parse_bounties(page, url):
+                bounties.setdefault(bounty['id'], bounty)
+        
+        log_with_context(logging.INFO, "Successfully scraped bounties", count=len(bounties), pages=len(urls))
+        return list(bounties.values())
+    
+    async def _afetch_page(self, client: httpx.AsyncClient, url: str) -> Union[str, bytes]:
+        """Fetch one page's HTML."""
+        log_with_context(logging.INFO, "Fetching bounties", site_url=url)
+        response = await client.get(url)
+        response.raise_for_status()
+        return _response_html(response)
+    
+    def fetch_bounties_many(self, urls: List[str]) -> List[Dict]:
+        """
+        Synchronous wrapper around afetch_bounties_requests.
+        
+        Args:
+            urls: Pages to scrape
+            
+        Returns:
+            Bounties from every page that loaded, in page order
+        """
+        return asyncio.run(self.afetch_bounties_requests(urls))
+    
     def fetch_bounties_playwright(self) -> List[Dict]:
         """
         Fetch bounties using Playwright for JavaScript-heavy sites.
         Use this when the content is rendered client-side.
         
+        The browser is launched once and reused; each call only opens a new page.
+        
         Returns:
             List of bounty dictionaries with id, title, url, description
         """
+        return self._get_browser_executor().submit(self._fetch_bounties_playwright).result()
+    
+    async def afetch_bounties_playwright(self) -> List[Dict]:
+        """Async variant of fetch_bounties_playwright; the event loop is not blocked."""
+        return await asyncio.wrap_future(
+            self._get_browser_executor().submit(self._fetch_bounties_playwright)
+        )
+    
+    def _fetch_bounties_playwright(self) -> List[Dict]:
+        """Scrape site_url in a new page of the shared browser (browser thread only)."""
         try:
             log_with_context(logging.INFO, "Fetching bounties with Playwright", site_url=self.site_url)
             
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
-                # Set user agent
-                page.set_extra_http_headers({'User-Agent': get_user_agent()})
-                
+            page = self._get_browser_context().new_page()
+            try:
                 # Navigate to the page
                 page.goto(self.site_url, wait_until='networkidle')
                 
                 # Wait for page to load and look for elements containing bounty-related terms
-                page.wait_for_load_state('networkidle', timeout=15000)
+                page.wait_for_load_state('networkidle')
                 
                 # Try to find elements with bounty-related content
                 try:
@@ -143,61 +370,27 @@ class BountyScraper:
                     pass  # Continue even if no specific elements found
                 
                 # Extract bounty data by looking for elements containing 'thread', 'twitter', etc.
-                bounties = page.evaluate("""
-                    () => {
-                        const keywords = ['thread', 'twitter', 'bounty', 'task', 'job', 'opportunity', 'social', 'post', 'content', 'writing', 'article', 'blog', 'tweet', 'social media', 'marketing', 'promotion'];
-                        const allElements = document.querySelectorAll('div, article, section, li');
-                        const bountyElements = [];
-                        
-                        allElements.forEach(el => {
-                            const text = el.textContent.toLowerCase();
-                            const hasKeyword = keywords.some(keyword => text.includes(keyword));
-                            
-                            // Filter out navigation, header, and CSS elements
-                            const isNavigation = text.includes('login') || text.includes('sign up') || 
-                                               text.includes('become a sponsor') || text.includes('nprogress') ||
-                                               text.includes('pointer-events') || text.includes('background:') ||
-                                               text.includes('filter') || text.includes('sort') ||
-                                               text.includes('category') || text.includes('status') ||
-                                               el.tagName === 'NAV' || el.tagName === 'HEADER' ||
-                                               el.classList.contains('nav') || el.classList.contains('header') ||
-                                               el.classList.contains('filter') || el.classList.contains('sort');
-                            
-                            if (hasKeyword && el.textContent.trim().length > 20 && !isNavigation) {
-                                const link = el.querySelector('a') || el.closest('a');
-                                if (link && link.href && !link.href.includes('javascript:')) {
-                                    bountyElements.push({
-                                        href: link.href,
-                                        title: link.textContent.trim() || el.textContent.trim(),
-                                        description: el.textContent.trim(),
-                                        elementText: el.textContent.trim()
-                                    });
-                                }
-                            }
-                        });
-                        
-                        return bountyElements.slice(0, 20); // Limit to first 20 results
+                bounties = page.evaluate(_EXTRACT_BOUNTIES_JS, _EXTRACT_BOUNTIES_ARGS)
+            finally:
+                page.close()
+            
+            # Process the extracted data
+            # Keyed by bounty id: nested containers around the same link yield the same bounty
+            processed_bounties = {}
+            for bounty_data in bounties:
+                bounty_id = self._extract_bounty_id(bounty_data['href'], bounty_data['title'])
+                if bounty_id and bounty_data['title'] and bounty_id not in processed_bounties:
+                    processed_bounties[bounty_id] = {
+                        'id': bounty_id,
+                        'title': bounty_data['title'],
+                        'url': bounty_data['href'],
+                        'description': bounty_data['description'],
+                        'scraped_at': int(time.time())
                     }
-                """)
-                
-                browser.close()
-                
-                # Process the extracted data
-                processed_bounties = []
-                for bounty_data in bounties:
-                    bounty_id = self._extract_bounty_id(bounty_data['href'], bounty_data['title'])
-                    if bounty_id and bounty_data['title']:
-                        processed_bounties.append({
-                            'id': bounty_id,
-                            'title': bounty_data['title'],
-                            'url': bounty_data['href'],
-                            'description': bounty_data['description'],
-                            'scraped_at': int(time.time())
-                        })
-                
-                log_with_context(logging.INFO, "Successfully scraped bounties with Playwright", count=len(processed_bounties))
-                return processed_bounties
-                
+            
+            log_with_context(logging.INFO, "Successfully scraped bounties with Playwright", count=len(processed_bounties))
+            return list(processed_bounties.values())
+            
         except Exception as e:
             log_with_context(logging.ERROR, "Failed to fetch bounties with Playwright", error=str(e))
             raise
@@ -224,8 +417,7 @@ class BountyScraper:
                 return last_part
         
         # Fallback: create ID from title hash
-        import hashlib
-        return hashlib.md5(title.encode()).hexdigest()[:12]
+        return _title_hash_id(title)
     
     def fetch_bounties(self, use_playwright: bool = False) -> List[Dict]:
         """
@@ -241,6 +433,21 @@ class BountyScraper:
             return self.fetch_bounties_playwright()
         else:
             return self.fetch_bounties_requests()
+    
+    async def afetch_bounties(self, use_playwright: bool = False) -> List[Dict]:
+        """
+        Async variant of fetch_bounties for callers running on an event loop.
+        
+        Args:
+            use_playwright: Whether to use Playwright instead of requests
+            
+        Returns:
+            List of bounty dictionaries
+        """
+        if use_playwright:
+            return await self.afetch_bounties_playwright()
+        else:
+            return await asyncio.to_thread(self.fetch_bounties_requests)
 
 # Convenience function for backward compatibility
 def fetch_bounties(site_url: str = None, use_playwright: bool = False) -> List[Dict]:
@@ -254,5 +461,5 @@ def fetch_bounties(site_url: str = None, use_playwright: bool = False) -> List[D
     Returns:
         List of bounty dictionaries
     """
-    scraper = BountyScraper(site_url)
-    return scraper.fetch_bounties(use_playwright)
+    with BountyScraper(site_url) as scraper:
+        return scraper.fetch_bounties(use_playwright)
@@ -2,9 +2,12 @@
 Database storage and deduplication logic for the Twitter Bounty Bot.
 Handles Supabase operations for tracking seen bounties and posted threads.
 """
+import sqlite3
+import threading
 import time
 import json
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import List, Dict, Optional, Set, Tuple
 from supabase import create_client, Client
 from .config import SUPABASE_URL, SUPABASE_KEY, DATABASE_URL
 
@@ -13,6 +16,44 @@ supabase: Optional[Client] = None
 if SUPABASE_URL and SUPABASE_KEY:
     supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# SQLite fallback: one connection per thread, opened on first use and kept open
+_SQLITE_PATH = 'data.db'
+_local = threading.local()
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's SQLite connection, creating and configuring it on first use."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(_SQLITE_PATH)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        _local.conn = conn
+    return conn
+
+# Ids known to be seen, most recently used last. Seen is permanent, so only hits are
+# cached: a cached id never goes stale, while misses always go back to the database.
+SEEN_CACHE_MAX_ENTRIES = 4096
+_seen_cache: "OrderedDict[str, None]" = OrderedDict()
+_seen_cache_lock = threading.Lock()
+
+def _remember_seen(bounty_ids):
+    """Add ids to the seen cache, evicting the least recently used beyond the limit."""
+    with _seen_cache_lock:
+        for bounty_id in bounty_ids:
+            _seen_cache[bounty_id] = None
+            _seen_cache.move_to_end(bounty_id)
+        while len(_seen_cache) > SEEN_CACHE_MAX_ENTRIES:
+            _seen_cache.popitem(last=False)
+
+def _cached_seen(bounty_ids) -> Set[str]:
+    """Return the given ids that the seen cache already knows about."""
+    with _seen_cache_lock:
+        hits = {bounty_id for bounty_id in bounty_ids if bounty_id in _seen_cache}
+        for bounty_id in hits:
+            _seen_cache.move_to_end(bounty_id)
+    return hits
+
 def init_db():
     """Initialize the database and create tables."""
     if supabase:
@@ -29,79 +70,113 @@ def init_db():
     else:
         print("Using SQLite fallback - Supabase not configured")
         # Fallback to SQLite for local development
-        import sqlite3
-        conn = sqlite3.connect('data.db')
-        cursor = conn.cursor()
+        conn = _get_conn()
         
         # Create tables
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS seen_bounty (
-                id TEXT PRIMARY KEY,
-                title TEXT,
-                url TEXT,
-                seen_at INTEGER,
-                description TEXT
-            )
-        ''')
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS seen_bounty (
+                    id TEXT PRIMARY KEY,
+                    title TEXT,
+                    url TEXT,
+                    seen_at INTEGER,
+                    description TEXT
+                )
+            ''')
+            
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    bounty_id TEXT,
+                    posted_at INTEGER,
+                    tweet_thread_root_id TEXT,
+                    thread_tweets TEXT
+                )
+            ''')
+            
+            # Time-range lookups (recent posts, daily count) seek instead of scanning
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_posts_posted_at ON posts(posted_at)')
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                bounty_id TEXT,
-                posted_at INTEGER,
-                tweet_thread_root_id TEXT,
-                thread_tweets TEXT
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
         print("SQLite database initialized successfully")
 
 def is_bounty_seen(bounty_id: str) -> bool:
     """Check if a bounty has already been seen."""
+    if _cached_seen((bounty_id,)):
+        return True
+    
     if supabase:
         try:
-            result = supabase.table('seen_bounty').select('id').eq('id', bounty_id).execute()
-            return len(result.data) > 0
+            # Only the match count comes back, not the rows
+            result = (
+                supabase.table('seen_bounty')
+                .select('id', count='exact', head=True)
+                .eq('id', bounty_id)
+                .limit(1)
+                .execute()
+            )
+            seen = bool(result.count)
         except Exception as e:
             print(f"Error checking bounty in Supabase: {e}")
             return False
     else:
         # SQLite fallback
-        import sqlite3
-        conn = sqlite3.connect('data.db')
+        conn = _get_conn()
         cursor = conn.cursor()
-        cursor.execute('SELECT id FROM seen_bounty WHERE id = ?', (bounty_id,))
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
+        cursor.execute('SELECT 1 FROM seen_bounty WHERE id = ? LIMIT 1', (bounty_id,))
+        seen = cursor.fetchone() is not None
+    
+    if seen:
+        _remember_seen((bounty_id,))
+    return seen
 
-def mark_bounty_seen(bounty_id: str, title: str, url: str, description: str = None):
-    """Mark a bounty as seen."""
+# Maximum ids per IN (...) query; keeps below SQLite's bound-parameter limit
+_IN_QUERY_CHUNK_SIZE = 500
+
+def are_bounties_seen(bounty_ids: List[str]) -> Set[str]:
+    """
+    Return which of the given bounty ids have already been seen.
+    
+    Looks up all ids with one IN (...) query (per 500 ids) instead of one query each.
+    """
+    unique_ids = list(dict.fromkeys(bounty_ids))
+    cached = _cached_seen(unique_ids)
+    unique_ids = [bounty_id for bounty_id in unique_ids if bounty_id not in cached]
+    chunks = [
+        unique_ids[start:start + _IN_QUERY_CHUNK_SIZE]
+        for start in range(0, len(unique_ids), _IN_QUERY_CHUNK_SIZE)
+    ]
+    seen = set()
+    if not chunks:
+        return cached
+    
     if supabase:
         try:
-            supabase.table('seen_bounty').insert({
-                'id': bounty_id,
-                'title': title,
-                'url': url,
-                'seen_at': int(time.time()),
-                'description': description
-            }).execute()
+            for chunk in chunks:
+                result = supabase.table('seen_bounty').select('id').in_('id', chunk).execute()
+                seen.update(row['id'] for row in result.data)
         except Exception as e:
-            print(f"Error marking bounty as seen in Supabase: {e}")
-            raise e
+            print(f"Error checking bounties in Supabase: {e}")
+            return cached
     else:
         # SQLite fallback
-        import sqlite3
-        conn = sqlite3.connect('data.db')
+        conn = _get_conn()
         cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR IGNORE INTO seen_bounty (id, title, url, seen_at, description)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (bounty_id, title, url, int(time.time()), description))
-        conn.commit()
-        conn.close()
+        for chunk in chunks:
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'SELECT id FROM seen_bounty WHERE id IN ({placeholders})', chunk)
+            seen.update(row[0] for row in cursor.fetchall())
+    
+    _remember_seen(seen)
+    return seen | cached
+
+def filter_unseen(bounty_ids: List[str]) -> List[str]:
+    """Return the bounty ids that have not been seen yet, in their original order (deduplicated)."""
+    seen = are_bounties_seen(bounty_ids)
+    return [bounty_id for bounty_id in dict.fromkeys(bounty_ids) if bounty_id not in seen]
+
+def mark_bounty_seen(bounty_id: str, title: str, url: str, description: str = None):
+    """Mark a bounty as seen."""
+    mark_bounties_seen([(bounty_id, title, url, description)])
 
 def record_post(bounty_id: str, tweet_thread_root_id: str, thread_tweets: List[str]):
     """Record a posted thread."""
@@ -118,18 +193,101 @@ def record_post(bounty_id: str, tweet_thread_root_id: str, thread_tweets: List[s
             raise e
     else:
         # SQLite fallback
-        import sqlite3
-        conn = sqlite3.connect('data.db')
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO posts (bounty_id, posted_at, tweet_thread_root_id, thread_tweets)
-            VALUES (?, ?, ?, ?)
-        ''', (bounty_id, int(time.time()), tweet_thread_root_id, ','.join(thread_tweets)))
-        conn.commit()
-        conn.close()
-
-def get_recent_posts(hours: int = 24) -> List[Dict]:
-    """Get posts from the last N hours."""
+        conn = _get_conn()
+        with conn:
+            conn.execute('''
+                INSERT INTO posts (bounty_id, posted_at, tweet_thread_root_id, thread_tweets)
+                VALUES (?, ?, ?, ?)
+            ''', (bounty_id, int(time.time()), tweet_thread_root_id, ','.join(thread_tweets)))
+
+def mark_bounties_seen(rows: List[Tuple[str, str, str, Optional[str]]]):
+    """
+    Mark several bounties as seen in one write.
+    
+    Args:
+        rows: (bounty_id, title, url, description) tuples
+    """
+    if not rows:
+        return
+    
+    seen_at = int(time.time())
+    if supabase:
+        try:
+            supabase.table('seen_bounty').upsert([
+                {
+                    'id': bounty_id,
+                    'title': title,
+                    'url': url,
+                    'seen_at': seen_at,
+                    'description': description
+                }
+                for bounty_id, title, url, description in rows
+            ], ignore_duplicates=True).execute()
+        except Exception as e:
+            print(f"Error marking bounties as seen in Supabase: {e}")
+            raise e
+    else:
+        # SQLite fallback: one transaction, one commit
+        conn = _get_conn()
+        with conn:
+            conn.executemany('''
+                INSERT OR IGNORE INTO seen_bounty (id, title, url, seen_at, description)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [
+                (bounty_id, title, url, seen_at, description)
+                for bounty_id, title, url, description in rows
+            ])
+    
+    _remember_seen(row[0] for row in rows)
+
+def record_posts(rows: List[Tuple[str, str, List[str], int]]):
+    """
+    Record several posted threads in one write.
+    
+    Args:
+        rows: (bounty_id, tweet_thread_root_id, thread_tweets, posted_at) tuples
+    """
+    if not rows:
+        return
+    
+    if supabase:
+        try:
+            supabase.table('posts').insert([
+                {
+                    'bounty_id': bounty_id,
+                    'posted_at': posted_at,
+                    'tweet_thread_root_id': tweet_thread_root_id,
+                    'thread_tweets': ','.join(thread_tweets)
+                }
+                for bounty_id, tweet_thread_root_id, thread_tweets, posted_at in rows
+            ]).execute()
+        except Exception as e:
+            print(f"Error recording posts in Supabase: {e}")
+            raise e
+    else:
+        # SQLite fallback: one transaction, one commit
+        conn = _get_conn()
+        with conn:
+            conn.executemany('''
+                INSERT INTO posts (bounty_id, posted_at, tweet_thread_root_id, thread_tweets)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (bounty_id, posted_at, tweet_thread_root_id, ','.join(thread_tweets))
+                for bounty_id, tweet_thread_root_id, thread_tweets, posted_at in rows
+            ])
+
+def get_recent_posts(hours: int = 24, content_type: Optional[str] = None) -> List[Dict]:
+    """
+    Get posts from the last N hours.
+    
+    Args:
+        hours: How far back to look
+        content_type: Only return posts of this type ('news' or 'bounty'); every
+            recorded post is a bounty thread, so 'news' matches nothing
+    """
+    if content_type not in (None, 'bounty'):
+        return []
+    
     cutoff_time = int(time.time()) - (hours * 3600)
     
     if supabase:
@@ -149,12 +307,10 @@ def get_recent_posts(hours: int = 24) -> List[Dict]:
             return []
     else:
         # SQLite fallback
-        import sqlite3
-        conn = sqlite3.connect('data.db')
+        conn = _get_conn()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM posts WHERE posted_at >= ?', (cutoff_time,))
         posts = cursor.fetchall()
-        conn.close()
         
         return [
             {
@@ -166,23 +322,40 @@ def get_recent_posts(hours: int = 24) -> List[Dict]:
             for post in posts
         ]
 
+def get_engagement_data(hours: int = 24, content_type: Optional[str] = None) -> Dict:
+    """
+    Summarize posting activity over the last N hours.
+    
+    Likes and retweets are not tracked yet, so this reports what the posts table
+    records: how many threads were posted and how many tweets they contained.
+    
+    Args:
+        hours: How far back to look
+        content_type: Only count posts of this type (see get_recent_posts)
+    """
+    posts = get_recent_posts(hours, content_type)
+    return {
+        'post_count': len(posts),
+        'tweet_count': sum(len(post['thread_tweets']) for post in posts)
+    }
+
 def get_daily_post_count() -> int:
     """Get the number of posts made today."""
-    today_start = int(time.time()) - (int(time.time()) % 86400)  # Start of today
+    # Start of today (UTC); one clock read so both terms agree across midnight
+    now = int(time.time())
+    today_start = now - now % 86400
     
     if supabase:
         try:
-            result = supabase.table('posts').select('id', count='exact').gte('posted_at', today_start).execute()
+            result = supabase.table('posts').select('id', count='exact', head=True).gte('posted_at', today_start).execute()
             return result.count or 0
         except Exception as e:
             print(f"Error getting daily post count from Supabase: {e}")
             return 0
     else:
         # SQLite fallback
-        import sqlite3
-        conn = sqlite3.connect('data.db')
+        conn = _get_conn()
         cursor = conn.cursor()
         cursor.execute('SELECT COUNT(*) FROM posts WHERE posted_at >= ?', (today_start,))
         count = cursor.fetchone()[0]
-        conn.close()
         return count
@@ -1,24 +1,73 @@
 """
 Utility functions for rate limiting, backoff, and general helpers.
 """
+import re
 import time
 import random
+from time import sleep
 import logging
-from typing import Callable, Any
+from typing import Callable, Any, Optional, Tuple, Type
 from functools import wraps
+import requests
 from .config import MAX_RETRIES, RETRY_DELAY_SECONDS, MIN_POST_INTERVAL_SECONDS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def exponential_backoff(max_retries: int = MAX_RETRIES, base_delay: int = RETRY_DELAY_SECONDS):
+# Realistic browser user agent for web requests
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Characters that might cause issues in posts, mapped to safe replacements
+_SANITIZE_TABLE = str.maketrans({
+    '\n': ' ',
+    '\r': ' ',
+    '\t': ' ',
+    '\u201c': '"',  # left double quotation mark
+    '\u201d': '"',  # right double quotation mark
+    '\u2018': "'",  # left single quotation mark
+    '\u2019': "'",  # right single quotation mark
+    '\u2013': '-',  # en dash
+    '\u2014': '-',  # em dash
+})
+
+# Runs of whitespace collapse to a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Phrases that get a tweet flagged as potential spam, matched case-insensitively
+_SPAM_RE = re.compile(r'click here|free money|guaranteed|act now', re.IGNORECASE)
+
+# Errors worth retrying by default: the request may succeed on a later attempt
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (requests.ConnectionError, requests.Timeout)
+
+def _is_retryable(e: BaseException, retry_on: Tuple[Type[BaseException], ...]) -> bool:
+    """Whether e, or the error it was raised from (e.g. a client library's wrapper), is transient."""
+    return any(
+        isinstance(error, retry_on)
+        for error in (e, e.__cause__, e.__context__)
+        if error is not None
+    )
+
+def _retry_after_seconds(e: BaseException) -> Optional[float]:
+    """Return the server's Retry-After delay in seconds, if the error carries a response with one."""
+    response = getattr(e, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+def exponential_backoff(max_retries: int = MAX_RETRIES, base_delay: int = RETRY_DELAY_SECONDS,
+                        retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS):
     """
-    Decorator for exponential backoff on function failures.
+    Decorator for exponential backoff on transient function failures.
     
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds for exponential backoff
+        retry_on: Exception types to retry; anything else is raised immediately
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -31,14 +80,20 @@ def exponential_backoff(max_retries: int = MAX_RETRIES, base_delay: int = RETRY_
                 except Exception as e:
                     last_exception = e
                     
+                    if not _is_retryable(e, retry_on):
+                        raise
+                    
                     if attempt == max_retries:
-                        logger.error(f"Function {func.__name__} failed after {max_retries} retries: {e}")
+                        logger.error("Function %s failed after %s retries: %s", func.__name__, max_retries, e)
                         raise e
                     
-                    # Calculate delay with jitter
+                    # Calculate delay with jitter, waiting at least as long as the server asked
                     delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                    logger.warning(f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. Retrying in {delay:.2f}s")
-                    time.sleep(delay)
+                    retry_after = _retry_after_seconds(e)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    logger.warning("Function %s failed (attempt %s/%s): %s. Retrying in %.2fs", func.__name__, attempt + 1, max_retries + 1, e, delay)
+                    sleep(delay)
             
             raise last_exception
         return wrapper
@@ -72,13 +127,14 @@ def truncate_text(text: str, max_length: int) -> str:
         return text
     
     # Find the last space before the limit to avoid cutting words
-    truncated = text[:max_length-3]
-    last_space = truncated.rfind(' ')
+    # (searched in place, so the text is sliced only once)
+    cut = max_length - 3
+    last_space = text.rfind(' ', 0, cut)
     
     if last_space > max_length * 0.8:  # Only use word boundary if it's not too far back
-        truncated = truncated[:last_space]
+        cut = last_space
     
-    return truncated + '...'
+    return text[:cut] + '...'
 
 def sanitize_text(text: str) -> str:
     """
@@ -90,26 +146,8 @@ def sanitize_text(text: str) -> str:
     Returns:
         Sanitized text safe for posting
     """
-    # Remove or replace characters that might cause issues
-    replacements = {
-        '\n': ' ',
-        '\r': ' ',
-        '\t': ' ',
-        '"': '"',
-        '"': '"',
-        ''': "'",
-        ''': "'",
-        '–': '-',
-        '—': '-',
-    }
-    
-    sanitized = text
-    for old, new in replacements.items():
-        sanitized = sanitized.replace(old, new)
-    
-    # Remove multiple consecutive spaces
-    while '  ' in sanitized:
-        sanitized = sanitized.replace('  ', ' ')
+    # Replace characters that might cause issues, then collapse whitespace runs
+    sanitized = _WHITESPACE_RE.sub(' ', text.translate(_SANITIZE_TABLE))
     
     return sanitized.strip()
 
@@ -130,19 +168,16 @@ def validate_tweet_content(text: str) -> bool:
         return False
     
     # Check for potentially problematic content
-    spam_indicators = ['click here', 'free money', 'guaranteed', 'act now']
-    text_lower = text.lower()
-    
-    for indicator in spam_indicators:
-        if indicator in text_lower:
-            logger.warning(f"Tweet content flagged for potential spam: {indicator}")
-            return False
+    match = _SPAM_RE.search(text)
+    if match:
+        logger.warning("Tweet content flagged for potential spam: %s", match.group(0).lower())
+        return False
     
     return True
 
 def get_user_agent() -> str:
     """Get a realistic user agent string for web requests."""
-    return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    return _USER_AGENT
 
 def log_with_context(level: int, message: str, **kwargs):
     """
@@ -153,6 +188,11 @@ def log_with_context(level: int, message: str, **kwargs):
         message: Log message
         **kwargs: Additional context to include in the log
     """
-    context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-    full_message = f"{message} | {context}" if context else message
-    logger.log(level, full_message)
+    # Skip formatting the context entirely when the level is filtered out
+    if not logger.isEnabledFor(level):
+        return
+    
+    if kwargs:
+        context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
+        message = f"{message} | {context}"
+    logger.log(level, message)
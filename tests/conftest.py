@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Import the modules under test (and tweepy, requests, selectolax behind them) once,
+# when each worker loads conftest, rather than during collection of the first test file
+import src.poster
+import src.scraper
+
+# Dummy Twitter credentials, enough to get past the poster's credential check
+TW_CREDENTIALS = {
+    'TW_API_KEY': 'test_key',
+    'TW_API_SECRET': 'test_secret',
+    'TW_ACCESS_TOKEN': 'test_token',
+    'TW_ACCESS_SECRET': 'test_secret'
+}
+
+@pytest.fixture(scope="module")
+def tw_env():
+    """Set the Twitter credentials once per test module."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in TW_CREDENTIALS.items():
+            mp.setenv(name, value)
+            # config reads the environment at import time, so patch the poster's copies too
+            mp.setattr(src.poster, name, value)
+        yield TW_CREDENTIALS
+
+@pytest.fixture
+def make_mock_api():
+    """Factory for mock tweepy APIs whose credentials check succeeds as test_user."""
+    def _make(tweets=None):
+        mock_api = Mock()
+        mock_api.verify_credentials.return_value = SimpleNamespace(screen_name="test_user", id=12345)
+        if tweets is not None:
+            # Successive update_status calls return these posted tweets
+            mock_api.update_status.side_effect = tweets
+        return mock_api
+    return _make
+
+@pytest.fixture
+def mock_tw_api(make_mock_api):
+    """Mock tweepy API that the poster tests' tweepy patch hands out."""
+    return make_mock_api()
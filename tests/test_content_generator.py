@@ -0,0 +1,99 @@
+"""
+Tests for the content generator module.
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+import src.content_generator as content_generator_module
+import src.llm_service as llm_service_module
+from src.content_generator import ContentGenerator
+
+THREAD = ["A generated tweet long enough to keep", "A second generated tweet to keep"]
+
+class FakeLLMService:
+    """Stands in for OllamaService: every batch item gets the same thread."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def agenerate_threads_batch(self, items):
+        self.batches.append(items)
+        return [list(THREAD) for _ in items]
+
+@pytest.fixture
+def empty_history(monkeypatch):
+    """Stand in for storage: nothing has been posted yet."""
+    monkeypatch.setattr(content_generator_module, 'get_recent_posts', lambda hours=24, content_type=None: [])
+    monkeypatch.setattr(content_generator_module, 'get_engagement_data',
+                        lambda hours=24, content_type=None: {'post_count': 0, 'tweet_count': 0})
+
+@pytest.fixture
+def generator(monkeypatch, empty_history):
+    """Content generator backed by the fake LLM service and an empty posting history."""
+    monkeypatch.setattr(llm_service_module, 'OllamaService', FakeLLMService)
+    return ContentGenerator()
+
+def test_daily_content_plan(generator):
+    """Test that selected articles and bounties come back as scheduled items, best first."""
+    now = datetime.now()
+    news = [
+        {'title': f"News {i}", 'url': f"https://example.com/{i}", 'relevance_score': i / 10,
+         'sentiment_score': 0.5, 'published_at': now}
+        for i in range(5)
+    ]
+    bounties = [
+        {'title': f"Web3 bounty {i}", 'description': "Write about DeFi", 'url': f"https://example.com/b{i}",
+         'reward_amount': f"{i * 100} USDC", 'deadline': now + timedelta(days=7), 'category': 'content'}
+        for i in range(5)
+    ]
+
+    plan = generator.generate_daily_content_plan(news, bounties)
+
+    # 80% of the news and 20% of the bounties, generated in one batch
+    assert len(generator.llm_service.batches) == 1
+    assert len(plan) == 5
+    assert [item['type'] for item in plan].count('bounty') == 1
+    assert all(item['content'] == THREAD for item in plan)
+    assert all(item['scheduled_time'] > now for item in plan)
+    priorities = [item['priority'] for item in plan]
+    assert priorities == sorted(priorities, reverse=True)
+
+def test_daily_content_plan_inside_event_loop(generator):
+    """Test that the sync wrapper refuses to run on a running loop and names the async variant."""
+    async def plan_from_loop():
+        return generator.generate_daily_content_plan([], [])
+
+    with pytest.raises(RuntimeError, match="agenerate_daily_content_plan"):
+        asyncio.run(plan_from_loop())
+
+def test_daily_content_plan_max_items(generator):
+    """Test that max_items keeps only the highest-priority items."""
+    news = [{'title': f"News {i}", 'relevance_score': i / 10} for i in range(10)]
+
+    plan = generator.generate_daily_content_plan(news, [], max_items=3)
+
+    assert [item['source_data']['title'] for item in plan] == ["News 9", "News 8", "News 7"]
+
+def test_daily_content_plan_rerun_reuses_threads(monkeypatch, empty_history):
+    """Test that rerunning the plan on the same generator reuses threads for unchanged articles."""
+    generator = ContentGenerator()
+    prompts = []
+
+    async def fake_generate(prompt, context=None, max_tokens=None, system=None, max_tweets=None):
+        prompts.append(prompt)
+        return "\n".join(f"Tweet {i}: {tweet}" for i, tweet in enumerate(THREAD, 1))
+    monkeypatch.setattr(generator.llm_service, 'agenerate_content', fake_generate)
+
+    news = [{'title': f"News {i}", 'url': f"https://example.com/{i}", 'relevance_score': i / 10} for i in range(5)]
+    generator.generate_daily_content_plan(news, [])
+    assert len(prompts) == 4
+
+    # A later run sees one new article alongside the four already generated
+    news.append({'title': "Breaking", 'url': "https://example.com/breaking", 'relevance_score': 1.0})
+    second_plan = generator.generate_daily_content_plan(news, [])
+
+    # Only the new article went to the model; the other three threads came from the cache
+    assert len(prompts) == 5
+    assert "Breaking" in prompts[-1]
+    assert [item['source_data']['title'] for item in second_plan] == ["Breaking", "News 4", "News 3", "News 2"]
+    assert all(item['content'] == THREAD for item in second_plan)
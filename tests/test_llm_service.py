@@ -0,0 +1,37 @@
+"""
+Tests for the LLM service module.
+"""
+import json
+import pytest
+from src.llm_service import OllamaService, _append_stream_chunk
+
+# A tweet exactly at the 280 character limit
+FULL_TWEET = "x" * 280
+
+@pytest.fixture(scope="module")
+def service():
+    """Service shared by the tests that only call its parsing helpers (no requests are made)."""
+    return OllamaService()
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_parse_thread_numbered_tweets(service, newline):
+    """Test that numbered tweet lines are extracted without padding or line endings."""
+    content = newline.join([
+        "Here is your thread:",
+        "Tweet 1:  First tweet  ",
+        "  Tweet 2: Second tweet",
+        f"Tweet 3: {FULL_TWEET}",
+        "",
+    ])
+
+    assert service._parse_thread(content) == ["First tweet", "Second tweet", FULL_TWEET]
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_stream_stops_after_max_tweets(newline):
+    """Test that streaming stops once enough complete tweet lines (within the limit) arrived."""
+    parts = []
+    chunks = [f"Tweet 1: {FULL_TWEET}{newline}Tweet 2: Second", f" tweet{newline}Tweet 3"]
+
+    done = [_append_stream_chunk(parts, json.dumps({'response': chunk}), max_tweets=2) for chunk in chunks]
+
+    assert done == [False, True]
@@ -2,9 +2,64 @@
 Tests for the scraper module.
 """
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from src.scraper import BountyScraper, fetch_bounties
 
+# md5(b"Test Bounty").hexdigest()[:12]: pins the legacy title-hash id scheme,
+# since changing it would make every previously seen bounty look new
+TEST_BOUNTY_TITLE_HASH = "0a65c607a459"
+
+# Listing page with two bounty rows, as the raw bytes a server would send
+BOUNTY_HTML = b"""
+<html>
+    <body>
+        <div class="bounty-row">
+            <a href="/bounty/123">Test Bounty 1</a>
+            <div class="description">Test description 1</div>
+        </div>
+        <div class="bounty-row">
+            <a href="/bounty/456">Test Bounty 2</a>
+            <div class="description">Test description 2</div>
+        </div>
+    </body>
+</html>
+"""
+
+# Listing page without any bounties
+EMPTY_HTML = b"<html><body><p>No open bounties right now.</p></body></html>"
+
+# Listing page with a single bounty row
+SINGLE_HTML = b"""
+<html>
+    <body>
+        <div class="bounty-row">
+            <a href="/bounty/789">Solo</a>
+        </div>
+    </body>
+</html>
+"""
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_session():
+    """Stand in for the shared HTTP session so no test builds real connection pools."""
+    session = Mock(spec=requests.Session)
+    session.headers = {}
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('src.scraper._default_session', lambda: session)
+        yield session
+
+@pytest.fixture
+def mock_session_get(mock_session):
+    """The mock session's get(), reset for each test."""
+    mock_session.get.reset_mock(return_value=True, side_effect=True)
+    return mock_session.get
+
+@pytest.fixture(scope="module")
+def scraper():
+    """Scraper shared by the tests that only call its parsing helpers."""
+    return BountyScraper("https://example.com")
+
 class TestBountyScraper:
     """Test cases for BountyScraper class."""
     
@@ -14,59 +69,58 @@ class TestBountyScraper:
         assert scraper.site_url == "https://example.com"
         assert scraper.session is not None
     
-    def test_extract_bounty_id_from_url(self):
-        """Test bounty ID extraction from URL."""
-        scraper = BountyScraper()
-        
-        # Test numeric ID
-        assert scraper._extract_bounty_id("https://example.com/bounty/123", "Test Bounty") == "123"
+    @pytest.mark.parametrize("url,title,expected", [
+        ("https://example.com/bounty/123", "Test Bounty", "123"),  # numeric ID
+        ("https://example.com/bounty/test-bounty", "Test Bounty", "test-bounty"),  # slug ID
+        ("https://example.com/bounty", "Test Bounty", TEST_BOUNTY_TITLE_HASH),  # fallback to hash
+    ])
+    def test_extract_bounty_id(self, scraper, url, title, expected):
+        """Test bounty ID extraction from URL, falling back to a title hash."""
+        result = scraper._extract_bounty_id(url, title)
         
-        # Test slug ID
-        assert scraper._extract_bounty_id("https://example.com/bounty/test-bounty", "Test Bounty") == "test-bounty"
-        
-        # Test fallback to hash
-        result = scraper._extract_bounty_id("https://example.com/bounty", "Test Bounty")
-        assert len(result) == 12  # MD5 hash length
+        assert result == expected
     
-    @patch('src.scraper.requests.Session.get')
-    def test_fetch_bounties_requests_success(self, mock_get):
-        """Test successful bounty fetching with requests."""
-        # Mock response
+    @pytest.mark.parametrize("html,expected_ids,expected_titles", [
+        (BOUNTY_HTML, ["123", "456"], ["Test Bounty 1", "Test Bounty 2"]),
+        (EMPTY_HTML, [], []),
+        (SINGLE_HTML, ["789"], ["Solo"]),
+    ], ids=["two-rows", "empty", "single-row"])
+    def test_fetch_bounties_requests(self, scraper, mock_session_get, html, expected_ids, expected_titles):
+        """Test bounty fetching with requests across listing pages."""
+        # Mock response; UTF-8 bodies reach the parser as raw bytes
         mock_response = Mock()
-        mock_response.text = """
-        <html>
-            <body>
-                <div class="bounty-row">
-                    <a href="/bounty/123">Test Bounty 1</a>
-                    <div class="description">Test description 1</div>
-                </div>
-                <div class="bounty-row">
-                    <a href="/bounty/456">Test Bounty 2</a>
-                    <div class="description">Test description 2</div>
-                </div>
-            </body>
-        </html>
-        """
+        mock_response.content = html
+        mock_response.encoding = 'utf-8'
         mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_session_get.return_value = mock_response
         
-        scraper = BountyScraper("https://example.com")
         bounties = scraper.fetch_bounties_requests()
         
-        assert len(bounties) == 2
-        assert bounties[0]['title'] == "Test Bounty 1"
-        assert bounties[0]['id'] == "123"
-        assert bounties[1]['title'] == "Test Bounty 2"
-        assert bounties[1]['id'] == "456"
+        assert [bounty['id'] for bounty in bounties] == expected_ids
+        assert [bounty['title'] for bounty in bounties] == expected_titles
+    
+    @pytest.mark.parametrize("base_url,href,expected", [
+        ("https://example.com", "/bounty/123", "https://example.com/bounty/123"),
+        ("https://example.com/bounties/", "bounty/123", "https://example.com/bounties/bounty/123"),
+        ("https://example.com/bounties?page=2", "?page=3", "https://example.com/bounties?page=3"),
+        ("https://example.com", "//cdn.example.com/bounty/123", "https://cdn.example.com/bounty/123"),
+        ("https://example.com", "https://other.example/bounty/123", "https://other.example/bounty/123"),
+    ], ids=["root-relative", "path-relative", "query-only", "scheme-relative", "absolute"])
+    def test_parse_bounties_resolves_links(self, scraper, base_url, href, expected):
+        """Test that bounty links are resolved against the page URL like a browser would."""
+        html = f'<div class="bounty-row"><a href="{href}">Test Bounty</a></div>'
+        
+        bounties = scraper._parse_bounties(html, base_url)
+        
+        assert [bounty['url'] for bounty in bounties] == [expected]
     
-    @patch('src.scraper.requests.Session.get')
-    def test_fetch_bounties_requests_error(self, mock_get):
+    def test_fetch_bounties_requests_error(self, mock_session_get):
         """Test error handling in bounty fetching."""
-        mock_get.side_effect = Exception("Network error")
+        mock_session_get.side_effect = requests.exceptions.ConnectionError("Network error")
         
         scraper = BountyScraper("https://example.com")
         
-        with pytest.raises(Exception):
+        with pytest.raises(requests.exceptions.RequestException, match="Network error"):
             scraper.fetch_bounties_requests()
     
     def test_fetch_bounties_function(self):
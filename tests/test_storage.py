@@ -0,0 +1,88 @@
+"""
+Tests for the storage module.
+"""
+import threading
+import pytest
+import src.storage as storage_module
+from src.storage import init_db, mark_bounties_seen, record_posts, get_recent_posts, filter_unseen
+
+@pytest.fixture(autouse=True)
+def sqlite_db(monkeypatch, tmp_path):
+    """Point storage at a fresh SQLite database in a temp directory, with an empty seen cache."""
+    monkeypatch.setattr(storage_module, 'supabase', None)
+    monkeypatch.setattr(storage_module, '_SQLITE_PATH', str(tmp_path / 'data.db'))
+    # A fresh thread-local, so no connection to another test's database is reused
+    monkeypatch.setattr(storage_module, '_local', threading.local())
+    storage_module._seen_cache.clear()
+    init_db()
+    yield
+    conn = getattr(storage_module._local, 'conn', None)
+    if conn is not None:
+        conn.close()
+    storage_module._seen_cache.clear()
+
+def test_batch_round_trip():
+    """Test that batched seen marks and post records read back through the lookups."""
+    mark_bounties_seen([
+        ('123', "Test Bounty 1", "https://example.com/bounty/123", "Description 1"),
+        ('456', "Test Bounty 2", "https://example.com/bounty/456", None),
+    ])
+    posted_at = int(storage_module.time.time())
+    record_posts([
+        ('123', '111', ['111', '222'], posted_at),
+        ('456', '333', ['333'], posted_at),
+    ])
+
+    assert filter_unseen(['123', '789', '456']) == ['789']
+    assert get_recent_posts(hours=1) == [
+        {'bounty_id': '123', 'posted_at': posted_at, 'tweet_thread_root_id': '111', 'thread_tweets': ['111', '222']},
+        {'bounty_id': '456', 'posted_at': posted_at, 'tweet_thread_root_id': '333', 'thread_tweets': ['333']},
+    ]
+
+def _forget_cache():
+    """Drop every cached seen id, so lookups have to go back to the database."""
+    storage_module._seen_cache.clear()
+
+def test_seen_cache_hit_skips_database(monkeypatch):
+    """Test that ids marked seen are answered from the cache without a query."""
+    mark_bounties_seen([('123', "Test Bounty", "https://example.com/bounty/123", None)])
+
+    def no_database():
+        raise AssertionError("cache hit should not touch the database")
+    monkeypatch.setattr(storage_module, '_get_conn', no_database)
+
+    assert storage_module.is_bounty_seen('123') is True
+    assert filter_unseen(['123']) == []
+
+def test_seen_cache_miss_goes_to_database():
+    """Test that a cache miss is looked up, and only seen ids are then cached."""
+    mark_bounties_seen([('123', "Test Bounty", "https://example.com/bounty/123", None)])
+    _forget_cache()
+
+    assert storage_module.is_bounty_seen('123') is True
+    assert storage_module.is_bounty_seen('789') is False
+    # Unseen ids are never cached: they may be marked seen at any moment
+    assert list(storage_module._seen_cache) == ['123']
+
+def test_seen_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the cache stays bounded, dropping the least recently used id first."""
+    monkeypatch.setattr(storage_module, 'SEEN_CACHE_MAX_ENTRIES', 2)
+    mark_bounties_seen([(bounty_id, bounty_id, '', None) for bounty_id in ('1', '2')])
+    storage_module.is_bounty_seen('1')  # '1' becomes the most recently used
+    mark_bounties_seen([('3', '3', '', None)])
+
+    assert list(storage_module._seen_cache) == ['1', '3']
+
+def test_are_bounties_seen_chunks_queries():
+    """Test that large lookups are split into IN (...) queries of at most 500 ids."""
+    bounty_ids = [str(i) for i in range(1200)]
+    mark_bounties_seen([(bounty_id, bounty_id, '', None) for bounty_id in bounty_ids[::2]])
+    _forget_cache()
+
+    statements = []
+    storage_module._get_conn().set_trace_callback(statements.append)
+    seen = storage_module.are_bounties_seen(bounty_ids)
+    storage_module._get_conn().set_trace_callback(None)
+
+    assert seen == set(bounty_ids[::2])
+    assert len([sql for sql in statements if 'IN (' in sql]) == 3
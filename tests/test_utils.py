@@ -0,0 +1,74 @@
+"""
+Tests for the utils module.
+"""
+import pytest
+import requests
+from types import SimpleNamespace
+from unittest.mock import Mock
+import src.utils as utils_module
+from src.utils import exponential_backoff
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping, with the jitter pinned to zero."""
+    delays = []
+    # Patch only the bindings utils uses, not the stdlib modules shared by the whole worker
+    monkeypatch.setattr(utils_module, 'sleep', delays.append)
+    monkeypatch.setattr(utils_module, 'random', SimpleNamespace(uniform=lambda low, high: 0))
+    return delays
+
+def _retrying(func, **kwargs):
+    """Wrap func with the backoff decorator (3 retries, 1s base delay unless overridden)."""
+    func.__name__ = 'flaky'  # the decorator logs the wrapped function's name
+    return exponential_backoff(**{'max_retries': 3, 'base_delay': 1, **kwargs})(func)
+
+def test_backoff_raises_non_retryable_immediately(sleeps):
+    """Test that an error outside retry_on is raised on the first attempt, without waiting."""
+    func = Mock(side_effect=ValueError("bad input"))
+
+    with pytest.raises(ValueError, match="bad input"):
+        _retrying(func)()
+
+    assert func.call_count == 1
+    assert sleeps == []
+
+def test_backoff_retries_transient_errors(sleeps):
+    """Test that transient errors are retried with doubling delays until the call succeeds."""
+    func = Mock(side_effect=[requests.ConnectionError(), requests.Timeout(), "ok"])
+
+    assert _retrying(func)() == "ok"
+    assert func.call_count == 3
+    assert sleeps == [1, 2]
+
+def test_backoff_gives_up_after_max_retries(sleeps):
+    """Test that the last transient error is raised once the retries are used up."""
+    func = Mock(side_effect=requests.ConnectionError("down"))
+
+    with pytest.raises(requests.ConnectionError, match="down"):
+        _retrying(func, max_retries=2)()
+
+    assert func.call_count == 3
+    assert sleeps == [1, 2]
+
+@pytest.mark.parametrize("link", ['__cause__', '__context__'])
+def test_backoff_retries_wrapped_transient_errors(sleeps, link):
+    """Test that a client library's wrapper around a transient error is retried."""
+    wrapper = RuntimeError("request failed")
+    setattr(wrapper, link, requests.ConnectionError())
+    func = Mock(side_effect=[wrapper, "ok"])
+
+    assert _retrying(func)() == "ok"
+    assert sleeps == [1]
+
+@pytest.mark.parametrize("retry_after,expected_delay", [
+    ("30", 30.0),  # the server asks for longer than the backoff
+    ("0.5", 1),    # the backoff is already longer
+    ("soon", 1),   # unparseable header
+])
+def test_backoff_honors_retry_after(sleeps, retry_after, expected_delay):
+    """Test that the delay is at least the server's Retry-After."""
+    error = requests.HTTPError(response=SimpleNamespace(headers={'Retry-After': retry_after}))
+    func = Mock(side_effect=[error, "ok"])
+
+    assert _retrying(func, retry_on=(requests.HTTPError,))() == "ok"
+    assert sleeps == [expected_delay]